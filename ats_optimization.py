@@ -19,26 +19,204 @@ Implements ATS compliance checks for resume structuring and tailoring.
 """
 
 import re
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+# Tokens keep skill punctuation such as C++, C#, Node.js and CI/CD
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in into is it its of on or our the their this to
+    we will with you your who what when where how all any can may must should would about across
+    experience years year work working team teams role job strong ability skills including etc
+""".split())
+
+def tokenize(text):
+    """Lowercase text and split it into keyword tokens, dropping stopwords and bare numbers."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower())
+            if token not in STOPWORDS and not token.isdigit()]
+
+# Keys optimize_for_ats writes into the resume; never scored as resume content
+ATS_REPORT_KEY = "ats_keyword_report"
+
+def resume_to_text(data):
+    """Flatten resume sections (strings, lists or nested dicts) into one text block."""
+    if isinstance(data, str):
+        return data
+    if isinstance(data, dict):
+        return "\n".join(resume_to_text(value) for key, value in data.items() if key != ATS_REPORT_KEY)
+    if isinstance(data, (list, tuple)):
+        return "\n".join(resume_to_text(item) for item in data)
+    return ""
+
+def load_job_descriptions(path=None):
+    """
+    Load job postings as (job_id, text) pairs from the Huntr job description export.
+    Accepts a list of job objects or a mapping of job id to text or job object.
+    """
+    with open(path or PATHS["job_description_file"], "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    def job_text(job):
+        if isinstance(job, str):
+            return job
+        fields = ("title", "jobTitle", "company", "description", "job_description", "text")
+        return "\n".join(str(job[field]) for field in fields if job.get(field))
+
+    if isinstance(jobs, dict):
+        return [(str(job_id), job_text(job)) for job_id, job in jobs.items()]
+    # Positional fallback ids are prefixed so they can't collide with CSV rows or real ids
+    return [(str(job.get("id", f"json-{index}")) if isinstance(job, dict) else f"json-{index}", job_text(job))
+            for index, job in enumerate(jobs)]
+
+def build_vocabulary(token_lists):
+    """Map every distinct token to a column index."""
+    vocabulary = {}
+    for tokens in token_lists:
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    return vocabulary
+
+def term_count_matrix(token_lists, vocabulary):
+    """Documents x vocabulary term counts; tokens outside the vocabulary are ignored."""
+    matrix = np.zeros((len(token_lists), len(vocabulary)), dtype=np.int32)
+    for row, tokens in enumerate(token_lists):
+        columns = [vocabulary[token] for token in tokens if token in vocabulary]
+        if columns:
+            matrix[row] = np.bincount(columns, minlength=len(vocabulary))
+    return matrix
+
+def score_keyword_coverage(resume_texts, job_texts, keyword_density=3):
+    """
+    Score every resume against every job in one pass over a shared job vocabulary.
+    Returns resumes x jobs matrices:
+      coverage - share of a job's keywords that appear in the resume at all
+      density  - share of a job's keywords that appear at least `keyword_density` times
+    """
+    job_tokens = [tokenize(text) for text in job_texts]
+    vocabulary = build_vocabulary(job_tokens)
+    job_keywords = term_count_matrix(job_tokens, vocabulary) > 0
+    resume_counts = term_count_matrix([tokenize(text) for text in resume_texts], vocabulary)
+
+    keyword_totals = np.maximum(job_keywords.sum(axis=1), 1).astype(np.float32)
+    job_matrix = job_keywords.T.astype(np.float32)
+    coverage = ((resume_counts > 0).astype(np.float32) @ job_matrix) / keyword_totals
+    density = ((resume_counts >= keyword_density).astype(np.float32) @ job_matrix) / keyword_totals
+
+    return {
+        "coverage": coverage,
+        "density": density,
+        "vocabulary": vocabulary,
+        "resume_counts": resume_counts,
+        "job_keywords": job_keywords
+    }
+
+def score_resumes_against_jobs(resumes, keyword_density=3, job_description_path=None):
+    """Score resume dicts against every saved job description; rows follow `resumes`, columns `job_ids`."""
+    jobs = load_job_descriptions(job_description_path)
+    scores = score_keyword_coverage([resume_to_text(resume) for resume in resumes],
+                                    [text for _, text in jobs], keyword_density)
+    scores["job_ids"] = [job_id for job_id, _ in jobs]
+    return scores
+
+def keyword_report(data, job_description, keyword_density=3, top_missing=15):
+    """Coverage, density and the most frequent missing job keywords for a single resume."""
+    scores = score_keyword_coverage([resume_to_text(data)], [job_description], keyword_density)
+    terms = list(scores["vocabulary"])
+    job_counts = term_count_matrix([tokenize(job_description)], scores["vocabulary"])[0]
+    missing = np.flatnonzero(scores["job_keywords"][0] & (scores["resume_counts"][0] == 0))
+    missing = sorted(missing, key=lambda column: -job_counts[column])[:top_missing]
+    return {
+        "coverage": round(float(scores["coverage"][0, 0]), 4),
+        "density": round(float(scores["density"][0, 0]), 4),
+        "missing_keywords": [terms[column] for column in missing]
+    }
+
+# Bullet vectors are cached per resume section so re-tailoring to many jobs skips re-tokenizing.
+# Each entry carries its own vocabulary, so evicting an entry frees everything it added.
+BULLET_CACHE_SIZE = 256
+_bullet_vector_cache = OrderedDict()
+
+def bullet_vectors(bullets):
+    """
+    Term ids and owning bullet index for a list of bullets, as flat arrays, plus the
+    token -> id vocabulary of just these bullets. Results are cached on the bullet contents.
+    """
+    key = tuple(resume_to_text(bullet) for bullet in bullets)
+    cached = _bullet_vector_cache.get(key)
+    if cached is not None:
+        _bullet_vector_cache.move_to_end(key)
+        return cached
+
+    vocabulary = {}
+    term_ids, owners, lengths = [], [], []
+    for position, text in enumerate(key):
+        unique_terms = {vocabulary.setdefault(token, len(vocabulary)) for token in tokenize(text)}
+        term_ids.extend(unique_terms)
+        owners.extend([position] * len(unique_terms))
+        lengths.append(len(unique_terms))
+    vectors = (np.array(term_ids, dtype=np.int64), np.array(owners, dtype=np.int64),
+               np.sqrt(np.maximum(np.array(lengths, dtype=np.float32), 1)), vocabulary)
+
+    _bullet_vector_cache[key] = vectors
+    if len(_bullet_vector_cache) > BULLET_CACHE_SIZE:
+        _bullet_vector_cache.popitem(last=False)
+    return vectors
+
+def job_term_counts(job_description):
+    """Token counts of a job description; tokenize once and reuse across resume sections."""
+    return Counter(tokenize(job_description))
+
+def job_term_weights(job_counts, vocabulary):
+    """Log-scaled job term frequencies for the terms of one bullet vocabulary."""
+    weights = np.zeros(len(vocabulary), dtype=np.float32)
+    for token, count in job_counts.items():
+        term_id = vocabulary.get(token)
+        if term_id is not None:
+            weights[term_id] = count
+    return np.log1p(weights)
+
+def select_bullets(bullets, job_description, limit, job_counts=None):
+    """Keep the `limit` bullets most relevant to the job description, in their original order."""
+    if len(bullets) <= limit:
+        return list(bullets)
+    term_ids, owners, lengths, vocabulary = bullet_vectors(bullets)
+    weights = job_term_weights(job_counts if job_counts is not None else job_term_counts(job_description), vocabulary)
+
+    # One pass over every bullet term: sum matched job weights per bullet, length-normalised
+    scores = np.bincount(owners, weights=weights[term_ids], minlength=len(bullets)) / lengths
+    keep = np.sort(np.argsort(-scores, kind="stable")[:limit])  # Stable: ties favour earlier bullets
+    return [bullets[position] for position in keep]
 
 # ATS Optimization Rules
-def optimize_for_ats(data):
-    """Ensure the resume meets ATS compliance standards."""
+def optimize_for_ats(data, job_description=None):
+    """Ensure the resume meets ATS compliance standards, scoring keywords when a job description is given."""
     ats_rules = {
         "keyword_density": 3,  # Minimum required occurrences per key skill
         "max_bullet_points": 5,
         "required_sections": ["Work Experience", "Education", "Skills"]
     }
-    
+
+    # Validate bullet points, keeping the most job-relevant ones when a job description is given
+    sections = [section for section in ["Work Experience", "Education"]
+                if isinstance(data.get(section, []), list) and len(data[section]) > ats_rules["max_bullet_points"]]
+    if job_description:
+        job_counts = job_term_counts(job_description)
+    for section in sections:
+        if job_description:
+            data[section] = select_bullets(data[section], job_description, ats_rules["max_bullet_points"], job_counts)
+        else:
+            data[section] = data[section][:ats_rules["max_bullet_points"]]
+
+    # Report on the bullets that survived trimming, before "[MISSING]" placeholders are added
+    if job_description:
+        data[ATS_REPORT_KEY] = keyword_report(data, job_description, ats_rules["keyword_density"])
+
     # Ensure required sections exist
     for section in ats_rules["required_sections"]:
         if section not in data:
             data[section] = "[MISSING]"
     
-    # Validate bullet points
-    for section in ["Work Experience", "Education"]:
-        if isinstance(data.get(section, []), list) and len(data[section]) > ats_rules["max_bullet_points"]:
-            data[section] = data[section][:ats_rules["max_bullet_points"]]
-    
     print("[ATS Optimization] Resume adjusted for ATS compliance.")
     return data
 
@@ -48,5 +226,6 @@ if __name__ == "__main__":
         "Education": ["BSc in Computer Science"],
         "Skills": ["Python", "SQL"]
     }
-    processed_data = optimize_for_ats(sample_data)
+    sample_job = "Senior Data Engineer: Python, SQL, Spark, Airflow and AWS. CI/CD and Agile delivery."
+    processed_data = optimize_for_ats(sample_data, job_description=sample_job)
     print("ATS Optimized Data:", processed_data)
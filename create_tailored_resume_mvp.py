@@ -1,6 +1,6 @@
 import sys
 import os
-from jira_manager import create_jira_epic, create_jira_story, create_jira_task, create_jira_subtask
+from jira_manager import create_issue_hierarchy
 
 # ✅ Dynamically set the path to ensure imports work
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
@@ -13,14 +13,6 @@ epic_description = (
     "and custom resume formatting."
 )
 
-# ✅ Create the Epic
-epic_key = create_jira_epic(epic_title, epic_description)
-if not epic_key:
-    print("❌ Epic creation failed. Exiting script.")
-    sys.exit(1)
-
-print(f"✅ Created Epic: {epic_key}")
-
 # ✅ Define Stories and Associated Tasks
 stories = [
     {
@@ -122,32 +114,29 @@ stories = [
     }
 ]
 
-# ✅ Create Stories and Store Their Jira Keys
-story_keys = {}
-
-for story in stories:
-    story_key = create_jira_story(story["title"], story["description"], epic_key)  # ✅ Story under Epic
-    if not story_key:
-        print(f"❌ Failed to create Story: {story['title']}")
-        continue
+# ✅ Create the Epic, its Stories and their Tasks level by level with bulk requests
+hierarchy = [{
+    "type": "Epic",
+    "title": epic_title,
+    "description": epic_description,
+    "children": [
+        {
+            "type": "Story",
+            "title": story["title"],
+            "description": story["description"],
+            # 🚀 Tasks are created as Subtasks under the Story
+            "children": [{"type": "Sub-task", **task} for task in story["tasks"]],
+        }
+        for story in stories
+    ],
+}]
 
-    print(f"✅ Created Story: {story_key}")
-    story_keys[story["title"]] = story_key  # Store Story Key for later Task linking
-
-# ✅ Create Tasks under Each Story
-for story_title, story_key in story_keys.items():
-    story_data = next(s for s in stories if s["title"] == story_title)
-    
-    for task in story_data["tasks"]:
-        task_description = task["description"]
-        task_title = task["title"]
-
-        # 🚀 Create Tasks as Subtasks under the Story
-        task_key = create_jira_subtask(task_title, task_description, story_key)  
+report = create_issue_hierarchy(hierarchy)
+if not hierarchy[0].get("key"):
+    print("❌ Epic creation failed. Exiting script.")
+    sys.exit(1)
 
-        if not task_key:
-            print(f"❌ Failed to create Task: {task_title}")
-        else:
-            print(f"✅ Created Task under Story {story_key}: {task_key}")
+for failure in report["failures"]:
+    print(f"❌ Failed: {failure['path']} | {failure['error']}")
 
 print("🚀 Tailored Resume MVP Jira import completed successfully!")
@@ -1,7 +1,6 @@
 import os
 import sys
 import json
-import requests
 
 # Get the absolute path of the project root dynamically
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +21,7 @@ print("✅ Updated sys.path:", sys.path)
 # Import modules using absolute paths relative to 'src'
 from modules.utils.path_manager import PATHS
 from modules.security.jira_secrets import get_secret
+from jira_client import JiraClient, JiraSearchError
 
 # Retrieve Jira credentials from AWS Secrets Manager
 secret_name = "BN-Jira-Credentials"
@@ -41,29 +41,25 @@ HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
 }
+JIRA_CLIENT = JiraClient(JIRA_BASE_URL, auth=JIRA_AUTH, headers=HEADERS)
 
 # JQL Query to Find Test Issues
 JQL_QUERY = f'project = "{JIRA_PROJECT_KEY}" AND (summary ~ "Test" OR description ~ "Test")'
 
 def get_test_issues():
-    """Fetches all test issues from Jira."""
-    search_url = f"{JIRA_BASE_URL}/rest/api/3/search"
-    params = {"jql": JQL_QUERY, "maxResults": 50}
-    
-    response = requests.get(search_url, headers=HEADERS, auth=JIRA_AUTH, params=params)
-    
-    if response.status_code == 200:
-        issues = response.json().get("issues", [])
-        return issues
-    else:
-        print(f"❌ Failed to fetch test issues: {response.json()}")
+    """Fetches all test issues from Jira, following every result page."""
+    try:
+        # ✅ Collected before deleting so removals can't shift later pages
+        return list(JIRA_CLIENT.search(JQL_QUERY, fields=["summary"]))
+    except JiraSearchError as e:
+        print(f"❌ Failed to fetch test issues: {e}")
         return []
 
 def delete_jira_issue(issue_key):
     """Deletes a Jira issue by its key."""
-    delete_url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}"
+    delete_url = f"/rest/api/3/issue/{issue_key}"
     
-    response = requests.delete(delete_url, headers=HEADERS, auth=JIRA_AUTH)
+    response = JIRA_CLIENT.delete(delete_url)
     
     if response.status_code == 204:
         print(f"✅ Deleted issue: {issue_key}")
@@ -82,3 +78,4 @@ if __name__ == "__main__":
             delete_jira_issue(issue_key)
 
         print("\n✅ All test issues deleted successfully!\n")
+        JIRA_CLIENT.report_metrics()
@@ -0,0 +1,490 @@
+import os
+import sys
+import re
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import subprocess
+from datetime import datetime
+import pdfplumber
+from docx import Document
+
+try:
+    import resource  # Unix only; peak RSS is skipped elsewhere
+except ImportError:
+    resource = None
+
+# ✅ Dynamically add the project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up two levels
+sys.path.append(project_root)
+
+from modules.utils.path_manager import PATHS
+from modules.extraction.resume_json_standardization import STANDARD_SECTIONS, SECTION_HEADER_INDEX
+from modules.extraction.contact_extractor import EMAIL_REGEX, extract_contact_details, extract_contact_details_batch
+from modules.extraction.resume_extraction_pipeline import (
+    EXTRACTOR_VERSION, clean_extracted_text, extract_text_from_pdf, extract_text_from_docx,
+    extract_contact_info, classify_sections, iter_docx_paragraphs, _extract_docx_with_python_docx
+)
+
+"""
+extraction_benchmark.py
+Benchmark suite for the resume extraction pipeline: per-stage latency percentiles,
+pages/sec and peak memory on the bundled sample PDFs and synthetic DOCX/PDF corpora,
+plus micro-benchmarks comparing optimized code paths against the ones they replaced.
+Results are written as JSON so runs can be compared across commits.
+"""
+
+# Large sample PDFs shipped alongside the source
+SAMPLE_PDFS = [
+    "bn_api_plugin.pdf",
+    "bn_tracking_json.pdf",
+    "bn_try_cinco.pdf",
+    "bn_try_quatro.pdf",
+    "bn_trydos.pdf",
+    "bn_tryme.pdf",
+    "bn_trytres.pdf",
+    "jira_automation.pdf",
+]
+PERCENTILES = (50, 90, 99)
+
+# ----------------------------------------------
+# Reference implementations (pre-optimization)
+# ----------------------------------------------
+
+def legacy_classify_lines(lines):
+    """Original header detection: lowercase each line once per keyword test."""
+    sections = {}
+    current_section = "General"
+    for line in lines:
+        if len(line.strip()) > 3:
+            if "experience" in line.lower():
+                current_section = "Experience"
+            elif "education" in line.lower():
+                current_section = "Education"
+            elif "skills" in line.lower():
+                current_section = "Skills"
+            sections.setdefault(current_section, []).append(line)
+    return sections
+
+def legacy_classify_sections(text):
+    """Original classify_sections: split, legacy header detection, then join each section."""
+    return {k: "\n".join(v) for k, v in legacy_classify_lines(text.split("\n")).items()}
+
+def legacy_match_section_name(section):
+    """Original standardize_sections matching: rebuild variants and compile a regex per standard."""
+    for standard, variants in STANDARD_SECTIONS.items():
+        if section.lower() in [v.lower() for v in variants] or re.search(r"\b" + re.escape(section) + r"\b", " ".join(variants), re.IGNORECASE):
+            return standard
+    return None
+
+def legacy_extract_contact_info(text):
+    """Original contact extraction: three uncompiled re.search calls, first match only."""
+    def safe_search(pattern, text):
+        match = re.search(pattern, text)
+        return match.group(0).strip() if match else None
+    return {
+        "email": safe_search(EMAIL_REGEX, text),
+        "phone": safe_search(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", text),
+        "linkedin": safe_search(r"(https?:\/\/)?([\w]+\.)?linkedin\.com\/in\/[\w-]+", text)
+    }
+
+# ----------------------------------------------
+# Synthetic inputs
+# ----------------------------------------------
+
+BODY_LINES = [
+    "Led a team of five engineers delivering a customer analytics platform",
+    "Reduced cloud spend by 30% through rightsizing and reserved capacity",
+    "Built ETL pipelines in Python and SQL feeding the finance data mart",
+    "Mentored junior developers and ran weekly code reviews",
+    "Designed REST APIs consumed by mobile and web clients",
+]
+
+def synthetic_resume_lines(line_count, seed=0):
+    """Generate resume-like lines with a header roughly every dozen lines."""
+    rng = random.Random(seed)
+    headers = [variant for variants in STANDARD_SECTIONS.values() for variant in variants]
+    return [rng.choice(headers) if i % 12 == 0 else rng.choice(BODY_LINES) for i in range(line_count)]
+
+def synthetic_section_names(count, seed=0):
+    """Mix of known variants, case/whitespace variations and unknown headings."""
+    rng = random.Random(seed)
+    known = [variant for variants in STANDARD_SECTIONS.values() for variant in variants] + list(STANDARD_SECTIONS)
+    unknown = ["Volunteer Work", "Publications", "Languages", "Hobbies", "References"]
+    return [rng.choice([rng.choice(known), rng.choice(known).upper(), rng.choice(unknown)]) for _ in range(count)]
+
+def synthetic_resume_texts(count, lines=150, seed=0):
+    """
+    Resume-sized texts with dates and IDs that look numeric. The contact line sits at the top
+    or the bottom, and every third resume has no LinkedIn URL.
+    """
+    texts = []
+    for i in range(count):
+        body = "\n".join(synthetic_resume_lines(lines, seed=seed + i))
+        contact = f"Candidate {i} | candidate{i}@example.com | (555) 010-{i % 10000:04d}"
+        if i % 3:
+            contact += f" | https://www.linkedin.com/in/candidate{i}"
+        dates = "2016 - 2021 | ID 4821"
+        texts.append(f"{contact}\n{dates}\n{body}" if i % 2 else f"{dates}\n{body}\n{contact}")
+    return texts
+
+def build_docx_corpus(output_dir, count=100, paragraphs=400, seed=0):
+    """Write synthetic DOCX resumes with body paragraphs and a skills table."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(count):
+        doc = Document()
+        for line in synthetic_resume_lines(paragraphs, seed=seed + i):
+            doc.add_paragraph(line)
+        table = doc.add_table(rows=10, cols=3)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = rng.choice(["Python", "SQL", "AWS", "Kubernetes", "Tableau", "Spark"])
+        path = os.path.join(output_dir, f"synthetic_{i:04d}.docx")
+        doc.save(path)
+        paths.append(path)
+    return paths
+
+def write_text_pdf(path, pages):
+    """Write a minimal text-layer PDF (Helvetica, one string per line) without extra dependencies."""
+    def escape(text):
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    objects = {3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    next_id = 4
+    for lines in pages:
+        page_id, content_id = next_id, next_id + 1
+        next_id += 2
+        stream = "BT /F1 10 Tf 14 TL 50 780 Td " + " ".join(f"({escape(line)}) '" for line in lines) + " ET"
+        objects[content_id] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+        objects[page_id] = ("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        kids.append(f"{page_id} 0 R")
+    objects[1] = "<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output += f"{object_id} 0 obj\n{objects[object_id]}\nendobj\n".encode("latin-1", "replace")
+    xref_offset = len(output)
+    output += f"xref\n0 {next_id}\n0000000000 65535 f \n".encode()
+    for object_id in range(1, next_id):
+        output += f"{offsets[object_id]:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {next_id} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+
+    with open(path, "wb") as f:
+        f.write(output)
+
+def build_pdf_corpus(output_dir, count=20, pages=3, seed=0):
+    """Write synthetic multi-page text PDFs with a contact line and section headers."""
+    paths = []
+    for i in range(count):
+        lines = [f"Candidate {i} | candidate{i}@example.com | (555) 010-{i % 10000:04d} | linkedin.com/in/candidate{i}"]
+        lines += synthetic_resume_lines(pages * 50 - 1, seed=seed + i)
+        path = os.path.join(output_dir, f"synthetic_{i:04d}.pdf")
+        write_text_pdf(path, [lines[start:start + 50] for start in range(0, len(lines), 50)])
+        paths.append(path)
+    return paths
+
+# ----------------------------------------------
+# Benchmarks
+# ----------------------------------------------
+
+def time_call(func, *args, repeat=5):
+    """Return the best wall-clock time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_section_headers(line_count=200_000, name_count=50_000):
+    """Compare legacy vs indexed header detection for classify_sections and standardize_sections."""
+    text = "\n".join(synthetic_resume_lines(line_count))
+    names = synthetic_section_names(name_count)
+
+    results = {
+        "classify_sections": {
+            "legacy_s": time_call(legacy_classify_sections, text),
+            "indexed_s": time_call(classify_sections, text),
+            "items": line_count
+        },
+        "match_section_name": {
+            "legacy_s": time_call(lambda: [legacy_match_section_name(n) for n in names]),
+            "indexed_s": time_call(lambda: [SECTION_HEADER_INDEX.match_section_name(n) for n in names]),
+            "items": name_count
+        }
+    }
+    for name, result in results.items():
+        result["speedup"] = round(result["legacy_s"] / result["indexed_s"], 2) if result["indexed_s"] else None
+        print(f"⏱️ {name}: legacy {result['legacy_s']:.4f}s | indexed {result['indexed_s']:.4f}s "
+              f"| {result['speedup']}x over {result['items']} items")
+    return results
+
+def benchmark_docx_extraction(corpus_dir=None, count=100):
+    """Compare streaming DOCX extraction against python-docx on a directory or synthetic corpus."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if corpus_dir:
+            paths = sorted(os.path.join(corpus_dir, f) for f in os.listdir(corpus_dir) if f.lower().endswith(".docx"))
+        else:
+            paths = build_docx_corpus(temp_dir, count=count)
+        if not paths:
+            print(f"❌ No DOCX files found in {corpus_dir}.")
+            return {}
+
+        total_mb = sum(os.path.getsize(path) for path in paths) / (1024 * 1024)
+        results = {}
+        for name, extract in [("python_docx", _extract_docx_with_python_docx),
+                              ("streaming", lambda path: "\n".join(iter_docx_paragraphs(path)))]:
+            seconds = time_call(lambda: [extract(path) for path in paths], repeat=3)
+            results[name] = {
+                "seconds": seconds,
+                "files_per_s": round(len(paths) / seconds, 1),
+                "mb_per_s": round(total_mb / seconds, 2)
+            }
+            print(f"⏱️ DOCX {name}: {results[name]['files_per_s']} files/s, {results[name]['mb_per_s']} MB/s "
+                  f"over {len(paths)} files")
+
+    results["speedup"] = round(results["python_docx"]["seconds"] / results["streaming"]["seconds"], 2)
+    print(f"⏱️ Streaming DOCX speedup: {results['speedup']}x")
+    return results
+
+def benchmark_contact_extraction(count=10_000, max_workers=None):
+    """Compare legacy first-match contact extraction against the all-matches engine."""
+    texts = synthetic_resume_texts(count)
+    results = {
+        "legacy_s": time_call(lambda: [legacy_extract_contact_info(text) for text in texts], repeat=1),
+        "single_pass_s": time_call(lambda: [extract_contact_details(text) for text in texts], repeat=1),
+        "pool_s": time_call(lambda: extract_contact_details_batch(texts, max_workers=max_workers), repeat=1),
+        "resumes": count
+    }
+    for key in ("legacy", "single_pass", "pool"):
+        results[f"{key}_resumes_per_s"] = round(count / results[f"{key}_s"], 1)
+    results["speedup"] = round(results["legacy_s"] / results["single_pass_s"], 2)
+    print(f"⏱️ Contacts: legacy {results['legacy_resumes_per_s']}/s | single-pass {results['single_pass_resumes_per_s']}/s "
+          f"| pool {results['pool_resumes_per_s']}/s over {count} resumes ({results['speedup']}x)")
+    return results
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+def summarize_latencies(samples):
+    """Reduce per-file stage timings (seconds) to millisecond percentiles."""
+    summary = {}
+    for stage, values in samples.items():
+        summary[stage] = {f"p{pct}_ms": round(percentile(values, pct) * 1000, 3) for pct in PERCENTILES}
+        summary[stage]["mean_ms"] = round(sum(values) / len(values) * 1000, 3)
+    return summary
+
+def count_pdf_pages(path):
+    """Page count from the PDF page tree (not timed)."""
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+def raw_extracted_text(path):
+    """Text layer of a PDF or DOCX before clean_extracted_text runs (not timed)."""
+    if path.lower().endswith(".pdf"):
+        with pdfplumber.open(path) as pdf:
+            return "\n".join(page.extract_text() or "" for page in pdf.pages)
+    return "\n".join(iter_docx_paragraphs(path))
+
+def run_stage_pipeline(extract, path):
+    """Run every extraction stage on one file, returning per-stage seconds."""
+    timings = {}
+    start = time.perf_counter()
+    text = extract(path)
+    timings["extract_text"] = time.perf_counter() - start
+
+    for stage, func in [("extract_contact_info", extract_contact_info),
+                        ("classify_sections", classify_sections)]:
+        start = time.perf_counter()
+        func(text)
+        timings[stage] = time.perf_counter() - start
+    timings["total"] = sum(timings.values())
+
+    # The extractors already clean their output, so time cleaning on the raw text layer;
+    # it is part of extract_text and left out of the total
+    raw_text = raw_extracted_text(path)
+    start = time.perf_counter()
+    clean_extracted_text(raw_text)
+    timings["clean_extracted_text"] = time.perf_counter() - start
+    return timings
+
+def peak_memory_kb(extract, paths):
+    """Largest traced Python allocation peak across full-pipeline runs of each file."""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for path in paths:
+            tracemalloc.reset_peak()
+            text = extract(path)
+            extract_contact_info(text)
+            classify_sections(text)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+def benchmark_corpus(name, paths, extract, measure_memory=True):
+    """Benchmark the full pipeline over a corpus and return its summary."""
+    is_pdf = extract is extract_text_from_pdf
+    samples = {}
+    pages = 0
+    start = time.perf_counter()
+    for path in paths:
+        for stage, seconds in run_stage_pipeline(extract, path).items():
+            samples.setdefault(stage, []).append(seconds)
+    wall_seconds = time.perf_counter() - start
+    if is_pdf:
+        pages = sum(count_pdf_pages(path) for path in paths)
+
+    result = {
+        "files": len(paths),
+        "bytes": sum(os.path.getsize(path) for path in paths),
+        "wall_seconds": round(wall_seconds, 4),
+        "files_per_s": round(len(paths) / wall_seconds, 2) if wall_seconds else None,
+        "stages": summarize_latencies(samples)
+    }
+    if is_pdf:
+        result["pages"] = pages
+        result["pages_per_s"] = round(pages / wall_seconds, 2) if wall_seconds else None
+    if measure_memory:
+        result["peak_traced_kb"] = peak_memory_kb(extract, paths)
+
+    rate = f"{result['pages_per_s']} pages/s" if is_pdf else f"{result['files_per_s']} files/s"
+    print(f"⏱️ {name}: {len(paths)} files, {rate}, total p50 {result['stages']['total']['p50_ms']} ms, "
+          f"p99 {result['stages']['total']['p99_ms']} ms")
+    return result
+
+def git_revision():
+    """Short commit hash of the working tree, if available."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=current_dir,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(sample_dir=current_dir, corpus_size=20, pdf_pages=3, docx_paragraphs=400,
+              measure_memory=True, micro=True, docx_corpus=None, docx_count=100,
+              line_count=200_000, name_count=50_000, contact_count=10_000):
+    """
+    Run every benchmark and return a JSON-serializable report.
+    `docx_corpus` is a directory of real DOCX files; when given, it is benchmarked
+    end to end and used for the streaming vs python-docx comparison.
+    """
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "git_revision": git_revision(),
+        "extractor_version": EXTRACTOR_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "corpora": {}
+    }
+
+    samples = [os.path.join(sample_dir, name) for name in SAMPLE_PDFS
+               if os.path.exists(os.path.join(sample_dir, name))]
+    if samples:
+        report["corpora"]["sample_pdfs"] = benchmark_corpus("sample_pdfs", samples, extract_text_from_pdf, measure_memory)
+    else:
+        print(f"⚠️ No bundled sample PDFs found in {sample_dir}; skipping.")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_paths = build_pdf_corpus(temp_dir, count=corpus_size, pages=pdf_pages)
+        report["corpora"]["synthetic_pdf"] = benchmark_corpus("synthetic_pdf", pdf_paths, extract_text_from_pdf, measure_memory)
+        docx_paths = build_docx_corpus(temp_dir, count=corpus_size, paragraphs=docx_paragraphs)
+        report["corpora"]["synthetic_docx"] = benchmark_corpus("synthetic_docx", docx_paths, extract_text_from_docx, measure_memory)
+
+    if docx_corpus:
+        corpus_paths = sorted(os.path.join(docx_corpus, f) for f in os.listdir(docx_corpus) if f.lower().endswith(".docx"))
+        if corpus_paths:
+            report["corpora"]["docx_corpus"] = benchmark_corpus("docx_corpus", corpus_paths, extract_text_from_docx, measure_memory)
+        else:
+            print(f"⚠️ No DOCX files found in {docx_corpus}; skipping.")
+
+    if micro:
+        report["micro"] = {
+            "section_headers": benchmark_section_headers(line_count, name_count),
+            "docx_extraction": benchmark_docx_extraction(docx_corpus, docx_count),
+            "contact_extraction": benchmark_contact_extraction(contact_count)
+        }
+
+    if resource:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        report["peak_rss_kb"] = peak_rss // 1024 if sys.platform == "darwin" else peak_rss  # macOS reports bytes
+    return report
+
+def save_report(report, output_path=None):
+    """Write a benchmark report to JSON and return its path."""
+    if output_path is None:
+        revision = report.get("git_revision") or "nogit"
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output_path = os.path.join(PATHS["benchmark_results_dir"], f"extraction_{stamp}_{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+    print(f"✅ Benchmark report saved to {output_path}.")
+    return output_path
+
+def compare_reports(baseline_path, report, threshold=0.10):
+    """Print per-stage p50 changes against a baseline report; return stages slower than the threshold."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = []
+    print(f"📊 Comparing against {baseline_path} (rev {baseline.get('git_revision')}):")
+    for corpus, result in report["corpora"].items():
+        previous = baseline.get("corpora", {}).get(corpus)
+        if not previous:
+            continue
+        for stage, stats in result["stages"].items():
+            before = previous["stages"].get(stage, {}).get("p50_ms")
+            after = stats["p50_ms"]
+            if not before:
+                continue
+            change = (after - before) / before
+            flag = "🔺" if change > threshold else "  "
+            print(f"{flag} {corpus}.{stage}: {before} → {after} ms ({change:+.1%})")
+            if change > threshold:
+                regressions.append(f"{corpus}.{stage}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark resume extraction code paths.")
+    parser.add_argument("--sample-dir", default=current_dir, help="Directory containing the bundled sample PDFs")
+    parser.add_argument("--corpus-size", type=int, default=20, help="Synthetic PDF and DOCX files to generate")
+    parser.add_argument("--pdf-pages", type=int, default=3, help="Pages per synthetic PDF")
+    parser.add_argument("--docx-paragraphs", type=int, default=400, help="Paragraphs per synthetic DOCX")
+    parser.add_argument("--docx-corpus", help="Directory of real DOCX files to benchmark (default: synthetic only)")
+    parser.add_argument("--docx-count", type=int, default=100, help="Synthetic DOCX files for the python-docx comparison")
+    parser.add_argument("--lines", type=int, default=200_000, help="Synthetic resume lines for header detection")
+    parser.add_argument("--names", type=int, default=50_000, help="Synthetic section names for standardization")
+    parser.add_argument("--contacts", type=int, default=10_000, help="Synthetic resumes for contact extraction")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory pass")
+    parser.add_argument("--no-micro", action="store_true", help="Skip micro-benchmarks of individual code paths")
+    parser.add_argument("--output", help="Report path (default: benchmark_results_dir/extraction_<time>_<rev>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="Previous report to compare stage latencies against")
+    args = parser.parse_args()
+
+    report = run_suite(args.sample_dir, args.corpus_size, args.pdf_pages, args.docx_paragraphs,
+                       measure_memory=not args.no_memory, micro=not args.no_micro,
+                       docx_corpus=args.docx_corpus, docx_count=args.docx_count,
+                       line_count=args.lines, name_count=args.names, contact_count=args.contacts)
+    save_report(report, args.output)
+    if args.compare and compare_reports(args.compare, report):
+        sys.exit(1)
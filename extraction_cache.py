@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+from datetime import datetime
+
+# ✅ Dynamically add the project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up two levels
+sys.path.append(project_root)
+
+from modules.utils.path_manager import PATHS
+from modules.utils.generate_file_index import get_file_hash
+
+"""
+extraction_cache.py
+Content-addressed on-disk cache for resume extraction results.
+Entries are keyed by the SHA-256 of the input file plus the extractor version,
+so edits to a resume or to the extraction logic never return stale results.
+"""
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+EVICTION_LOW_WATERMARK = 0.9  # Evict down to 90% of the budget to avoid evicting on every write
+
+
+class ExtractionCache:
+    """Size-bounded LRU cache of extraction results stored as JSON files."""
+
+    def __init__(self, cache_dir=None, version="1", max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or PATHS["extraction_cache_dir"]
+        self.version = str(version)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._entries())
+
+    def key_for(self, file_path):
+        """Return the cache key for a file, or None if it cannot be hashed."""
+        digest = get_file_hash(file_path)
+        return f"{digest}-v{self.version}" if digest else None
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _entries(self):
+        """Yield (path, size, last_used) for every stored entry."""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue  # Removed by another worker
+                yield path, stat.st_size, stat.st_mtime
+
+    def get(self, key):
+        """Return the cached result for a key, or None on a miss."""
+        if key is None:
+            self.misses += 1
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # Mark as recently used for LRU eviction
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry["result"]
+
+    def put(self, key, result, source=None):
+        """Store a result under a key, evicting least recently used entries if over budget."""
+        if key is None:
+            return
+
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "key": key,
+            "source": source,
+            "created": datetime.now().isoformat(),
+            "result": result
+        }
+
+        try:
+            previous_size = os.path.getsize(path)  # Overwriting an entry replaces its bytes
+        except OSError:
+            previous_size = 0
+
+        # Write to a temp file and rename so concurrent readers never see a partial entry
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+        self._size += os.path.getsize(path) - previous_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is under its low watermark."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICTION_LOW_WATERMARK
+
+        for path, size, _ in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass  # Already evicted by another worker
+            self._size -= size
+
+    def clear(self):
+        """Remove every cached entry."""
+        for path, _, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._size = 0
+
+    def stats(self):
+        """Return hit/miss counters and current cache size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes
+        }
+
+
+if __name__ == "__main__":
+    cache = ExtractionCache()
+    start = time.perf_counter()
+    entry_count = sum(1 for _ in cache._entries())
+    print(f"✅ Extraction cache at {cache.cache_dir}: {entry_count} entries "
+          f"({cache.stats()['size_bytes'] / 1024:.1f} KB) scanned in {time.perf_counter() - start:.3f}s")
@@ -1,7 +1,12 @@
+import io
 import os
 import sys
 import shutil
+import select
+import struct
+import time
 import zipfile
+from contextlib import contextmanager
 from datetime import datetime
 
 # Dynamically add the project root to sys.path
@@ -20,6 +25,98 @@ def ensure_directory_exists(directory):
     if not os.path.exists(directory):
         os.makedirs(directory)
 
+# ✅ Filesystem notifications (Linux inotify via libc; other platforms fall back to polling)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_MOVED_FROM = 0x00000040
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+def _open_inotify(directory):
+    """Return an inotify fd watching `directory`, or None when inotify is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MOVED_FROM
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+def _drain_inotify(fd):
+    """Consume pending events; callers re-check the directory rather than parse names."""
+    try:
+        while os.read(fd, 64 * INOTIFY_EVENT_HEADER.size + 4096):
+            pass
+    except BlockingIOError:
+        pass
+
+def wait_for_directory_state(directory, condition, timeout, poll_interval=1.0):
+    """
+    Wait until `condition(filenames)` returns a truthy value for the directory
+    listing and return that value. The listing is re-checked on every inotify
+    event, or every `poll_interval` seconds where inotify is unavailable.
+    Raises TimeoutError when `timeout` seconds pass first.
+    """
+    ensure_directory_exists(directory)
+    deadline = time.monotonic() + timeout
+    fd = _open_inotify(directory)
+    try:
+        while True:
+            # Check after the watch is in place so an event between check and wait can't be missed
+            result = condition(os.listdir(directory))
+            if result:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timed out after {timeout}s waiting on {directory}")
+            if fd is None:
+                time.sleep(min(poll_interval, remaining))
+            elif select.select([fd], [], [], remaining)[0]:
+                _drain_inotify(fd)
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+def wait_for_download(directory, prefix, suffix=".zip", ignore=(), timeout=180):
+    """
+    Wait for a completed browser download named `prefix*suffix` that is not in
+    `ignore`, with no matching in-progress `.part` file. Firefox creates an empty
+    placeholder under the final name first, so the file must also be non-empty
+    and, for zips, have a readable central directory. Returns its full path.
+    """
+    def completed(filenames):
+        partial = {name[:-len(".part")] for name in filenames if name.endswith(".part")}
+        for name in sorted(filenames):
+            if name.startswith(prefix) and name.endswith(suffix) and name not in ignore and name not in partial:
+                path = os.path.join(directory, name)
+                try:
+                    if os.path.getsize(path) == 0:
+                        continue
+                except OSError:
+                    continue
+                if suffix == ".zip" and not zipfile.is_zipfile(path):
+                    continue
+                return path
+        return None
+
+    return wait_for_directory_state(directory, completed, timeout)
+
+def wait_for_downloads_to_finish(directory, timeout=120):
+    """Wait until no browser `.part` files remain in `directory`."""
+    return wait_for_directory_state(
+        directory, lambda filenames: not any(name.endswith(".part") for name in filenames), timeout)
+
 # ✅ Move file to a target directory
 def move_file(source_path, destination_dir):
     """
@@ -30,29 +127,47 @@ def move_file(source_path, destination_dir):
     shutil.move(source_path, destination_path)
     return destination_path
 
-# ✅ Extract zip files and rename specific CSV
+# ✅ Locate the export CSV from the zip's central directory (no extraction, no directory scans)
+def find_zip_member(zip_ref, target_prefix, suffix=".csv"):
+    """Return the ZipInfo whose file name starts with `target_prefix` and ends with `suffix`."""
+    for info in zip_ref.infolist():
+        name = os.path.basename(info.filename)
+        if not info.is_dir() and name.startswith(target_prefix) and name.endswith(suffix):
+            return info
+    raise FileNotFoundError(f"No file matching '{target_prefix}*{suffix}' found in {zip_ref.filename}.")
+
+@contextmanager
+def open_zip_csv(zip_path, target_prefix="USER_JOBS_USER_FULL_DATA_DOWNLOAD"):
+    """Stream the matching CSV member as text, e.g. straight into csv.DictReader."""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zip_ref.open(find_zip_member(zip_ref, target_prefix)) as member:
+            yield io.TextIOWrapper(member, encoding="utf-8-sig", newline="")
+
+# ✅ Extract the export CSV from a zip and rename it
 def extract_and_rename_csv(zip_path, extract_to=None, target_prefix="USER_JOBS_USER_FULL_DATA_DOWNLOAD", renamed_file="huntr_export.csv"):
     """
-    Extracts a zip file, finds the CSV file that starts with the target_prefix,
-    renames it to 'huntr_export.csv', and moves it to the appropriate directory.
+    Streams only the CSV member that starts with target_prefix out of the zip
+    into `extract_to`/`renamed_file`. The data is written to a temporary file
+    and atomically renamed, so readers never see a partial CSV.
     """
     if extract_to is None:
         extract_to = PATHS["downloads"]
     
     ensure_directory_exists(extract_to)
+    renamed_path = os.path.join(extract_to, renamed_file)
+    temp_path = f"{renamed_path}.{os.getpid()}.tmp"
 
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
-
-    # Identify and rename the correct CSV file
-    for file in os.listdir(extract_to):
-        if file.startswith(target_prefix) and file.endswith(".csv"):
-            original_path = os.path.join(extract_to, file)
-            renamed_path = os.path.join(extract_to, renamed_file)
-            os.rename(original_path, renamed_path)
-            return renamed_path
+        member = find_zip_member(zip_ref, target_prefix)
+        try:
+            with zip_ref.open(member) as source, open(temp_path, "wb") as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+            os.replace(temp_path, renamed_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
 
-    raise FileNotFoundError(f"No file matching '{target_prefix}*.csv' found in extracted contents.")
+    return renamed_path
 
 # ✅ Cleanup old downloads
 def cleanup_downloads(directory, keep_recent=3):
@@ -5,6 +5,8 @@ from selenium.webdriver.support import expected_conditions as EC
 import time
 import os
 import sys
+import json
+import zipfile
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
@@ -15,8 +17,12 @@ sys.path.append(project_root)
 
 # ✅ Import required modules
 try:
-    from modules.file_management.file_manager import ensure_directory_exists, extract_and_rename_csv, cleanup_downloads, move_file
+    from modules.file_management.file_manager import (
+        ensure_directory_exists, extract_and_rename_csv, cleanup_downloads, move_file,
+        wait_for_download, wait_for_downloads_to_finish
+    )
     from modules.best_practices.file_management import enforce_naming_convention, validate_file, cleanup_temp_files
+    from modules.file_management.huntr_store import ingest_huntr_csv
     from modules.utils.path_manager import PATHS
     print("✅ Successfully imported file management modules.")
 except ImportError as e:
@@ -28,6 +34,24 @@ DOWNLOAD_DIR = PATHS.get("huntr_downloads")
 EXTRACT_DIR = PATHS.get("huntr_extracted")
 FINAL_CSV_NAME = "huntr_export.csv"
 EXPECTED_PREFIX = "USER_FULL_DATA_DOWNLOAD"
+DOWNLOAD_TIMEOUT = 180  # Seconds
+TIMINGS_LOG = os.path.join(PATHS["logs_dir"], "huntr_export_timings.jsonl")
+
+# ✅ Export latency, recorded per stage as seconds since the run started
+run_started = time.perf_counter()
+timings = {}
+
+def mark(stage):
+    timings[stage] = round(time.perf_counter() - run_started, 3)
+
+def report_timings():
+    """Print the per-stage latency and append it to the timings log."""
+    previous = 0.0
+    for stage, elapsed in timings.items():
+        print(f"⏱️ {stage:<20} {elapsed:8.2f}s  (+{elapsed - previous:.2f}s)")
+        previous = elapsed
+    with open(TIMINGS_LOG, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"run_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **timings}) + "\n")
 
 # ✅ Ensure paths are absolute
 DOWNLOAD_DIR = str(os.path.abspath(DOWNLOAD_DIR))
@@ -50,7 +74,8 @@ driver.maximize_window()
 
 try:
     driver.get("https://huntr.co/track/boards")
-    time.sleep(3)
+    WebDriverWait(driver, 15).until(lambda d: d.execute_script("return document.readyState") == "complete")
+    mark("boards_loaded")
     
     if "login" in driver.current_url:
         driver.get("https://huntr.co/login")
@@ -63,29 +88,25 @@ try:
         WebDriverWait(driver, 15).until(lambda d: "track/boards" in d.current_url)
 
     driver.get("https://huntr.co/settings")
-    time.sleep(5)
     
+    # ✅ Explicit wait replaces the fixed sleep: proceed as soon as the button is clickable
     download_button = WebDriverWait(driver, 30).until(
         EC.element_to_be_clickable((By.XPATH, "//p[contains(text(), 'Download my data')]")))
+    mark("settings_ready")
     existing_files = set(os.listdir(DOWNLOAD_DIR))
     download_button.click()
     
     WebDriverWait(driver, 120).until_not(
         EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'Processing your export')]")))
-    
-    max_wait_time = 180
-    start_time = time.time()
-    downloaded_zip = None
-
-    while time.time() - start_time < max_wait_time:
-        new_files = [f for f in os.listdir(DOWNLOAD_DIR) if f.startswith(EXPECTED_PREFIX) and f.endswith(".zip")]
-        if new_files:
-            downloaded_zip = os.path.join(DOWNLOAD_DIR, new_files[0])
-            break
-        time.sleep(5)
-
-    if not downloaded_zip:
+    mark("export_processed")
+
+    # ✅ Woken by inotify when Firefox renames the finished .part file (polls where inotify is unavailable)
+    try:
+        downloaded_zip = wait_for_download(DOWNLOAD_DIR, EXPECTED_PREFIX, ".zip",
+                                           ignore=existing_files, timeout=DOWNLOAD_TIMEOUT)
+    except TimeoutError:
         raise TimeoutException("⏳ Download file not found after waiting period!")
+    mark("zip_downloaded")
 
     # ✅ Check if the file already exists and handle accordingly
     if os.path.exists(downloaded_zip):
@@ -100,17 +121,25 @@ try:
     
     if not validate_file(extracted_csv):
         raise FileNotFoundError("❌ Validated file not found.")
+    mark("csv_extracted")
+
+    # ✅ Apply only the inserted/changed/deleted jobs to the local store
+    ingest_huntr_csv(extracted_csv)
+    mark("store_updated")
 
     cleanup_temp_files()
     cleanup_downloads(DOWNLOAD_DIR, keep_recent=3)
 
     # ✅ Ensure all downloads are completed before closing the browser
-    while any(f.endswith(".part") for f in os.listdir(DOWNLOAD_DIR)):
-        print("⏳ Waiting for downloads to complete...")
-        time.sleep(5)
+    try:
+        wait_for_downloads_to_finish(DOWNLOAD_DIR, timeout=DOWNLOAD_TIMEOUT)
+    except TimeoutError:
+        raise TimeoutException("⏳ Downloads still in progress after waiting period!")
     print("✅ All downloads completed. Proceeding to close browser.")
+    mark("complete")
+    report_timings()
 
-except (NoSuchElementException, TimeoutException, FileNotFoundError) as e:
+except (NoSuchElementException, TimeoutException, FileNotFoundError, zipfile.BadZipFile) as e:
     print(f"❌ Error: {e}")
 finally:
     driver.quit()
\ No newline at end of file
@@ -0,0 +1,242 @@
+import os
+import sys
+import csv
+import json
+import time
+import hashlib
+import sqlite3
+
+# ✅ Dynamically add the project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up two levels
+sys.path.append(project_root)
+
+from modules.utils.path_manager import PATHS
+
+"""
+huntr_store.py
+Incrementally updated SQLite store for Huntr CSV exports, keyed by job ID.
+Each export is stream-parsed and diffed against the stored row hashes, so only
+inserted, changed and deleted jobs are written. Every ingest gets a sequence
+number, letting downstream steps read just the rows that changed since they last ran.
+"""
+
+CSV_ID_COLUMNS = ("Job ID", "ID", "Id", "id", "_id")
+FALLBACK_ID_COLUMNS = ("Job Title", "Title", "Company", "Company Name", "URL", "Job URL")
+RESERVED_COLUMNS = ("job_id", "row_hash", "ingest_id", "deleted_at")
+
+
+def _quote(column):
+    """Quote a CSV header for use as an SQLite identifier."""
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _row_hash(row):
+    """Stable hash of a row; pass a dict of only the non-empty fields so new blank columns don't change it."""
+    return hashlib.sha1(json.dumps(row, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def job_id_columns(headers, id_column=None):
+    """The export's job ID column (or None) and the columns hashed into an ID when it is blank."""
+    headers = [header for header in headers if header and header not in RESERVED_COLUMNS]
+    id_column = id_column or next((column for column in CSV_ID_COLUMNS if column in headers), None)
+    fallback_columns = [column for column in FALLBACK_ID_COLUMNS if column in headers] or headers
+    return id_column, fallback_columns
+
+
+def row_job_id(row, id_column, fallback_columns):
+    """Stable job ID for a CSV row: its ID column, else a hash of the title/company/URL columns."""
+    if id_column and row.get(id_column):
+        return row[id_column]
+    return _row_hash([row.get(column) or "" for column in fallback_columns])
+
+
+class HuntrStore:
+    """SQLite table of Huntr jobs with one TEXT column per CSV header."""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or PATHS["huntr_store"]
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                row_hash TEXT NOT NULL,
+                ingest_id INTEGER NOT NULL,
+                deleted_at INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS jobs_ingest_id ON jobs (ingest_id);
+            CREATE TABLE IF NOT EXISTS ingests (
+                ingest_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT,
+                ingested_at REAL,
+                inserted INTEGER,
+                updated INTEGER,
+                deleted INTEGER,
+                unchanged INTEGER
+            );
+        """)
+        self._columns = self._table_columns()
+
+    def _table_columns(self):
+        return [row["name"] for row in self.conn.execute("PRAGMA table_info(jobs)")
+                if row["name"] not in RESERVED_COLUMNS]
+
+    def _ensure_columns(self, headers):
+        for header in headers:
+            if header not in self._columns:
+                self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {_quote(header)} TEXT")
+                self._columns.append(header)
+
+    def create_index(self, column):
+        """Index a CSV column that is filtered on often (e.g. 'Status' or 'Company')."""
+        name = "jobs_" + hashlib.sha1(column.encode("utf-8")).hexdigest()[:10]
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON jobs ({_quote(column)})")
+        self.conn.commit()
+
+    # ---------------------------------------------------------------- Ingestion
+
+    def ingest_csv(self, source, source_name=None, id_column=None):
+        """
+        Apply one full Huntr export to the store.
+        `source` is a CSV path or an open text stream; rows are parsed as they are read.
+        Jobs absent from the export are soft-deleted (deleted_at is set).
+        Returns a summary with the ingest id and inserted/updated/deleted/unchanged counts.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "r", encoding="utf-8-sig", newline="") as f:
+                return self.ingest_csv(f, source_name or os.fspath(source), id_column)
+
+        reader = csv.DictReader(source)
+        # Reserved names are store bookkeeping; a CSV column with the same name is ignored
+        headers = [header for header in (reader.fieldnames or []) if header and header not in RESERVED_COLUMNS]
+        id_column, fallback_columns = job_id_columns(headers, id_column)
+
+        known = {row["job_id"]: (row["row_hash"], row["deleted_at"])
+                 for row in self.conn.execute("SELECT job_id, row_hash, deleted_at FROM jobs")}
+        summary = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+        with self.conn:
+            self._ensure_columns(headers)
+            cursor = self.conn.execute(
+                "INSERT INTO ingests (source, ingested_at) VALUES (?, ?)", (source_name, time.time()))
+            ingest_id = cursor.lastrowid
+
+            # Write every stored column so ones missing from this export are reset to NULL
+            columns = list(self._columns)
+            column_list = ", ".join(_quote(column) for column in columns)
+            placeholders = ", ".join("?" for _ in columns)
+            updates = ", ".join(f"{_quote(column)} = excluded.{_quote(column)}" for column in columns)
+            upsert = (f"INSERT INTO jobs (job_id, row_hash, ingest_id, deleted_at, {column_list}) "
+                      f"VALUES (?, ?, ?, NULL, {placeholders}) "
+                      f"ON CONFLICT(job_id) DO UPDATE SET row_hash = excluded.row_hash, "
+                      f"ingest_id = excluded.ingest_id, deleted_at = NULL, {updates}")
+
+            seen, batch = set(), []
+            for row in reader:
+                fields = {header: row.get(header) or "" for header in headers}
+                job_id = row_job_id(row, id_column, fallback_columns)
+                if job_id in seen:
+                    continue
+                seen.add(job_id)
+
+                row_hash = _row_hash({header: value for header, value in fields.items() if value})
+                previous = known.get(job_id)
+                if previous is not None and previous[0] == row_hash and previous[1] is None:
+                    summary["unchanged"] += 1
+                    continue
+                summary["updated" if previous is not None and previous[1] is None else "inserted"] += 1
+                batch.append([job_id, row_hash, ingest_id, *(fields.get(column) for column in columns)])
+                if len(batch) >= 500:
+                    self.conn.executemany(upsert, batch)
+                    batch = []
+            if batch:
+                self.conn.executemany(upsert, batch)
+
+            deleted = [(ingest_id, ingest_id, job_id) for job_id, (_, deleted_at) in known.items()
+                       if job_id not in seen and deleted_at is None]
+            self.conn.executemany("UPDATE jobs SET deleted_at = ?, ingest_id = ? WHERE job_id = ?", deleted)
+            summary["deleted"] = len(deleted)
+
+            self.conn.execute(
+                "UPDATE ingests SET inserted = ?, updated = ?, deleted = ?, unchanged = ? WHERE ingest_id = ?",
+                (summary["inserted"], summary["updated"], summary["deleted"], summary["unchanged"], ingest_id))
+
+        summary["ingest_id"] = ingest_id
+        return summary
+
+    # ---------------------------------------------------------------- Queries
+
+    def query(self, filters=None, columns=None, include_deleted=False, limit=None):
+        """
+        Filtered read of stored jobs as dicts.
+        `filters` maps a column to a value, a list of values (IN) or an
+        (operator, value) tuple such as ("LIKE", "%Engineer%").
+        """
+        clauses, params = [], []
+        if not include_deleted:
+            clauses.append("deleted_at IS NULL")
+        for column, condition in (filters or {}).items():
+            if isinstance(condition, (list, set, frozenset)):
+                condition = list(condition)
+                clauses.append(f"{_quote(column)} IN ({', '.join('?' for _ in condition)})")
+                params.extend(condition)
+            elif isinstance(condition, tuple):
+                operator, value = condition
+                if operator.upper() not in ("=", "!=", "<", "<=", ">", ">=", "LIKE", "GLOB"):
+                    raise ValueError(f"Unsupported filter operator: {operator}")
+                clauses.append(f"{_quote(column)} {operator} ?")
+                params.append(value)
+            else:
+                clauses.append(f"{_quote(column)} = ?")
+                params.append(condition)
+
+        selected = ", ".join(_quote(column) for column in (["job_id", *columns] if columns else ["job_id", *self._columns]))
+        sql = f"SELECT {selected} FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def changes_since(self, ingest_id):
+        """Jobs inserted, updated or deleted after `ingest_id`: returns (upserted_rows, deleted_job_ids)."""
+        rows = self.conn.execute("SELECT * FROM jobs WHERE ingest_id > ?", (ingest_id,)).fetchall()
+        upserted = [{key: row[key] for key in row.keys() if key not in ("row_hash", "deleted_at")}
+                    for row in rows if row["deleted_at"] is None]
+        deleted = [row["job_id"] for row in rows if row["deleted_at"] is not None]
+        return upserted, deleted
+
+    def latest_ingest(self):
+        """Most recent ingest record as a dict, or None."""
+        row = self.conn.execute("SELECT * FROM ingests ORDER BY ingest_id DESC LIMIT 1").fetchone()
+        return dict(row) if row else None
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def ingest_huntr_csv(csv_path=None, db_path=None):
+    """Apply the latest Huntr export to the store and print what changed."""
+    with HuntrStore(db_path) as store:
+        summary = store.ingest_csv(csv_path or PATHS["huntr_csv"])
+    print(f"✅ Huntr store ingest #{summary['ingest_id']}: {summary['inserted']} inserted, "
+          f"{summary['updated']} updated, {summary['deleted']} deleted, {summary['unchanged']} unchanged")
+    return summary
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else PATHS["huntr_csv"]
+    if os.path.exists(csv_path):
+        ingest_huntr_csv(csv_path)
+    else:
+        print(f"❌ No Huntr export found at {csv_path}")
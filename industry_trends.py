@@ -2,9 +2,17 @@ import sys
 import os
 import json
 import re
+import time
 import datetime
+import asyncio
+import threading
 import requests
 
+try:
+    import httpx  # ✅ Optional: native async HTTP with connection pooling
+except ImportError:
+    httpx = None
+
 # Dynamically add the project root to sys.path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up two levels
@@ -13,49 +21,372 @@ sys.path.append(project_root)
 # Now, you can safely import modules
 from modules.utils.path_manager import PATHS
 
-# Load industry trends from external sources or stored datasets
-def fetch_industry_trends():
-    """Fetches latest industry trends from an API or a stored dataset."""
-    try:
-        # Example: Fetching from a placeholder API (Replace with actual API endpoint)
-        response = requests.get("https://api.example.com/job-trends")
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print("Warning: Unable to fetch live industry trends. Using fallback data.")
-    except Exception as e:
-        print(f"Error fetching industry trends: {e}")
-    
-    # Fallback industry trends (if API fails)
+# Trend source and caching policy (override the URL with INDUSTRY_TRENDS_URL)
+TRENDS_API_URL = os.environ.get("INDUSTRY_TRENDS_URL", "https://api.example.com/job-trends")
+TRENDS_CACHE_TTL = 6 * 60 * 60  # Seconds before cached trends are refreshed
+CONNECT_TIMEOUT = 2  # Seconds
+READ_TIMEOUT = 5  # Seconds
+FAILURE_BACKOFF = 60  # Seconds to serve fallback data after a failed cold fetch
+MAX_CONCURRENT_REQUESTS = 8
+TRENDS_PER_INDUSTRY = 10
+
+# Fallback industry trends (if the API fails and nothing is cached)
+FALLBACK_TRENDS = {
+    "General": ["Python", "Machine Learning", "Cloud Computing"],
+    "Data Science": ["Machine Learning", "AI Ethics", "MLOps", "SQL", "Deep Learning", "Big Data"],
+    "Software Engineering": ["Cloud Computing", "Microservices", "DevOps"],
+    "Cybersecurity": ["Zero Trust", "Identity Management", "Threat Intelligence"],
+}
+
+
+class TrendProvider:
+    """
+    Industry trends backed by an on-disk cache with a TTL.
+    Fresh cache entries are served directly; stale ones are served immediately
+    while a single background thread refreshes them (stale-while-revalidate).
+    Only a cold cache blocks on the network, and always under strict timeouts.
+    """
+
+    def __init__(self, url=TRENDS_API_URL, cache_path=None, ttl=TRENDS_CACHE_TTL,
+                 timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)):
+        self.url = url
+        self.cache_path = cache_path or PATHS["industry_trends_cache"]
+        self.ttl = ttl
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._entry = None
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+        self._failed_at = None
+
+    def _load_cache(self):
+        if self._entry is None and os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    self._entry = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable trends cache: {e}")
+        return self._entry
+
+    def _save_cache(self, entry):
+        temp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(temp_path, self.cache_path)
+
+    def fetch(self):
+        """Fetch trends from the API and update the cache; returns None on any failure."""
+        try:
+            response = self.session.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            trends = response.json()
+            if not isinstance(trends, dict):
+                raise ValueError(f"expected an object of industry trends, got {type(trends).__name__}")
+        except (requests.RequestException, ValueError) as e:
+            print(f"⚠️ Unable to fetch live industry trends: {e}")
+            self._failed_at = time.time()
+            return None
+
+        self._failed_at = None
+        entry = {"fetched_at": time.time(), "trends": trends}
+        with self._lock:
+            self._entry = entry
+        try:
+            self._save_cache(entry)
+        except OSError as e:
+            print(f"⚠️ Could not write trends cache: {e}")
+        return trends
+
+    def refresh_in_background(self):
+        """Start a background refresh unless one is already running."""
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return self._refresh_thread
+            self._refresh_thread = threading.Thread(target=self.fetch, name="trend-refresh", daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def wait_for_refresh(self, timeout=None):
+        """Block until the current background refresh (if any) finishes."""
+        thread = self._refresh_thread
+        if thread:
+            thread.join(timeout)
+
+    def _in_backoff(self):
+        """True shortly after a failed fetch, so a down API isn't hit once per resume."""
+        return bool(self._failed_at) and time.time() - self._failed_at < FAILURE_BACKOFF
+
+    def get(self):
+        """Return trends without ever waiting on the network when any cached copy exists."""
+        entry = self._load_cache()
+        if entry:
+            if time.time() - entry["fetched_at"] > self.ttl and not self._in_backoff():
+                self.refresh_in_background()
+            return entry["trends"]
+
+        # Cold cache: fetch synchronously, but don't retry on every resume while the API is down
+        if self._in_backoff():
+            return FALLBACK_TRENDS
+        trends = self.fetch()
+        return trends if trends is not None else FALLBACK_TRENDS
+
+
+# ---------------------------------------------------------------- Multiple trend sources
+
+def load_trend_sources(path=None):
+    """
+    Trend feeds from config/trend_sources.json, a list of
+    {"name", "url", "weight", "timeout"} objects. A "{industry}" placeholder in
+    the URL makes the feed per-industry. Defaults to the single API source.
+    """
+    path = path or PATHS["trend_sources"]
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return [{"name": "default", "url": TRENDS_API_URL, "weight": 1.0, "timeout": READ_TIMEOUT}]
+
+def _parse_trend_payload(payload, industry):
+    """
+    Normalise a feed response to {industry: [(trend, score), ...]}.
+    Accepts {industry: [...]} mappings or, for per-industry feeds, a bare list.
+    Items are names or {"name"/"trend", "score"} objects; unscored items score by rank.
+    """
+    if isinstance(payload, dict) and industry is not None and industry not in payload:
+        payload = payload.get("trends", payload)
+    if isinstance(payload, list):
+        payload = {industry or "General": payload}
+    if not isinstance(payload, dict):
+        return {}
+
+    parsed = {}
+    for name, items in payload.items():
+        if not isinstance(items, list):
+            continue
+        scored = []
+        for rank, item in enumerate(items):
+            if isinstance(item, dict):
+                trend = item.get("name") or item.get("trend")
+                score = item.get("score", 1.0 / (rank + 1))
+            else:
+                trend, score = item, 1.0 / (rank + 1)
+            if trend:
+                scored.append((str(trend), float(score)))
+        parsed[name] = scored
+    return parsed
+
+def merge_trends(results, limit=TRENDS_PER_INDUSTRY):
+    """
+    Merge (source, parsed) results into {industry: [trend, ...]}, ranked by the
+    weighted score summed across sources, so trends reported by several feeds rise.
+    """
+    totals = {}
+    for source, parsed in results:
+        weight = float(source.get("weight", 1.0))
+        for industry, scored in parsed.items():
+            bucket = totals.setdefault(industry, {})
+            for trend, score in scored:
+                key = trend.lower()
+                best_name, total = bucket.get(key, (trend, 0.0))
+                bucket[key] = (best_name, total + weight * score)
+
     return {
-        "Data Science": ["Machine Learning", "AI Ethics", "MLOps"],
-        "Software Engineering": ["Cloud Computing", "Microservices", "DevOps"],
-        "Cybersecurity": ["Zero Trust", "Identity Management", "Threat Intelligence"],
+        industry: [name for name, _ in sorted(bucket.values(), key=lambda item: -item[1])[:limit]]
+        for industry, bucket in totals.items()
     }
 
+async def _fetch_source(client, semaphore, source, industry):
+    """Fetch and parse one feed under the shared concurrency limit and its own timeout."""
+    url = source["url"].format(industry=industry) if industry else source["url"]
+    timeout = source.get("timeout", READ_TIMEOUT)
+    async with semaphore:
+        if httpx is not None:
+            response = await asyncio.wait_for(client.get(url, timeout=timeout), timeout)
+        else:
+            response = await asyncio.wait_for(
+                asyncio.to_thread(client.get, url, timeout=(CONNECT_TIMEOUT, timeout)), timeout)
+    response.raise_for_status()
+    return _parse_trend_payload(response.json(), industry)
+
+async def fetch_all_trends(industries=None, sources=None, max_concurrency=MAX_CONCURRENT_REQUESTS):
+    """
+    Query every configured source (per industry for templated URLs) concurrently
+    over one pooled client. Failed or slow sources are reported and skipped.
+    Returns (merged_trends, per_source_status).
+    """
+    sources = sources if sources is not None else load_trend_sources()
+    industries = list(industries or FALLBACK_TRENDS)
+    requests_to_make = [(source, industry if "{industry}" in source["url"] else None)
+                        for source in sources
+                        for industry in (industries if "{industry}" in source["url"] else [None])]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    if httpx is not None:
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        client = httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT))
+    else:
+        client = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_concurrency)
+        client.mount("http://", adapter)
+        client.mount("https://", adapter)
+
+    try:
+        outcomes = await asyncio.gather(
+            *(_fetch_source(client, semaphore, source, industry) for source, industry in requests_to_make),
+            return_exceptions=True)
+    finally:
+        if httpx is not None:
+            await client.aclose()
+        else:
+            client.close()
+
+    results, status = [], {}
+    for (source, industry), outcome in zip(requests_to_make, outcomes):
+        label = f"{source['name']}:{industry}" if industry else source["name"]
+        if isinstance(outcome, BaseException):
+            status[label] = f"❌ {type(outcome).__name__}: {outcome}"
+        else:
+            status[label] = "✅ ok"
+            results.append((source, outcome))
+    return merge_trends(results), status
+
+
+class MultiSourceTrendProvider(TrendProvider):
+    """TrendProvider whose refresh fans out to every configured source concurrently."""
+
+    def __init__(self, sources=None, cache_path=None, ttl=TRENDS_CACHE_TTL,
+                 industries=None, max_concurrency=MAX_CONCURRENT_REQUESTS):
+        super().__init__(url=None, cache_path=cache_path, ttl=ttl)
+        self.sources = sources
+        self.industries = industries
+        self.max_concurrency = max_concurrency
+        self.last_status = {}
+
+    def fetch(self):
+        """Fetch, merge and cache trends from all sources; returns None if every source failed."""
+        trends, self.last_status = asyncio.run(
+            fetch_all_trends(self.industries, self.sources, self.max_concurrency))
+        for label, outcome in self.last_status.items():
+            if not outcome.startswith("✅"):
+                print(f"⚠️ Trend source {label} failed: {outcome}")
+        if not trends:
+            self._failed_at = time.time()
+            return None
+
+        self._failed_at = None
+        entry = {"fetched_at": time.time(), "trends": trends, "sources": self.last_status}
+        with self._lock:
+            self._entry = entry
+        try:
+            self._save_cache(entry)
+        except OSError as e:
+            print(f"⚠️ Could not write trends cache: {e}")
+        return trends
+
+
+_default_provider = None
+
+def get_trend_provider():
+    """Process-wide provider, created on first use; multi-source when trend_sources.json exists."""
+    global _default_provider
+    if _default_provider is None:
+        if os.path.exists(PATHS["trend_sources"]):
+            _default_provider = MultiSourceTrendProvider(load_trend_sources())
+        else:
+            _default_provider = TrendProvider()
+    return _default_provider
+
+# Load industry trends from external sources or stored datasets
+def fetch_industry_trends(provider=None):
+    """Fetches latest industry trends from the cached provider (fallback data if unavailable)."""
+    return (provider or get_trend_provider()).get()
+
 # Inject relevant industry trends into the resume
 
-def inject_industry_trends(data):
+def inject_industry_trends(data, provider=None):
     """
-    Injects real-time industry job trends into the resume.
-    Uses an external API or mock data for now.
+    Injects industry job trends into the resume.
+    Trends come from the cached provider, so this never blocks on a warm cache.
     """
-    # TEMP FIX: Mock industry trends instead of calling the API
-    industry_trends_mock = {
-        "General": ["Python", "Machine Learning", "Cloud Computing"],
-        "Data Science": ["SQL", "Deep Learning", "Big Data"]
-    }
+    trends = fetch_industry_trends(provider)
+    if not isinstance(trends, dict):
+        trends = FALLBACK_TRENDS
 
     industry = data.get("industry", "General")
     if not isinstance(industry, dict):  # Ensure it's not a string
-        industry = industry_trends_mock.get(industry, industry_trends_mock["General"])
-
+        industry = trends.get(industry) or trends.get("General") or FALLBACK_TRENDS["General"]
 
     data["industry_trends"] = industry
     return data
 
+
+def serve_stub_routes(routes):
+    """
+    Start a local HTTP server for exercising trend fetching without external APIs.
+    `routes` maps a path to (payload, delay_seconds, status). Returns
+    (server, base_url); call server.shutdown() when done.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            payload, delay, status = routes.get(self.path, ({"error": "not found"}, 0.0, 404))
+            time.sleep(delay)
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def serve_stub_trends(trends, delay=0.0, status=200):
+    """Stub server with a single /job-trends route; returns (server, url)."""
+    server, base_url = serve_stub_routes({"/job-trends": (trends, delay, status)})
+    return server, f"{base_url}/job-trends"
+
 # Example usage
 if __name__ == "__main__":
+    import tempfile
+
+    # ✅ Exercise cold, fresh and stale cache paths against a slow local stub
+    server, url = serve_stub_trends({"General": ["Stub Trend"], "Data Science": ["Vector Databases"]}, delay=0.5)
+    cache_path = os.path.join(tempfile.mkdtemp(), "industry_trends_cache.json")
+    provider = TrendProvider(url=url, cache_path=cache_path, ttl=1)
+
+    for label in ("cold", "fresh", "stale"):
+        if label == "stale":
+            time.sleep(1.1)
+        start = time.perf_counter()
+        sample_resume = inject_industry_trends({"industry": "Data Science"}, provider)
+        print(f"✅ {label:5} cache: {sample_resume['industry_trends']} in {(time.perf_counter() - start) * 1000:.1f} ms")
+    provider.wait_for_refresh()
+    server.shutdown()
+
+    # ✅ Fan out to several slow feeds at once; one feed is too slow for its timeout
+    server, base_url = serve_stub_routes({
+        "/feed-a/Data%20Science": (["MLOps", "Vector Databases", "SQL"], 0.5, 200),
+        "/feed-a/General": (["Python", "Cloud Computing"], 0.5, 200),
+        "/feed-b": ({"Data Science": [{"name": "vector databases", "score": 0.9}, {"name": "LLMOps", "score": 0.4}]}, 0.5, 200),
+        "/feed-c": ({"General": ["Kubernetes"]}, 3.0, 200),
+    })
+    sources = [
+        {"name": "feed-a", "url": base_url + "/feed-a/{industry}", "weight": 1.0, "timeout": 2},
+        {"name": "feed-b", "url": base_url + "/feed-b", "weight": 2.0, "timeout": 2},
+        {"name": "feed-c", "url": base_url + "/feed-c", "weight": 1.0, "timeout": 1},
+    ]
+    start = time.perf_counter()
+    trends, status = asyncio.run(fetch_all_trends(["Data Science", "General"], sources))
+    print(f"✅ {len(status)} source requests in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(json.dumps({"industry_trends": trends, "sources": status}, indent=4))
+    server.shutdown()
+
     sample_resume = {"Skills": [{"industry": "Data Science", "skills": ["Python", "SQL"]}]}
     enhanced_resume = inject_industry_trends(sample_resume)
-    print(json.dumps(enhanced_resume, indent=4))
\ No newline at end of file
+    print(json.dumps(enhanced_resume, indent=4))
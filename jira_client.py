@@ -0,0 +1,224 @@
+import re
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+# ----------------------------------------------
+# 🚀 Pooled, retrying HTTP client for the Jira REST API
+# ----------------------------------------------
+
+DEFAULT_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF = 0.5  # Seconds; doubles per attempt
+MAX_BACKOFF = 30  # Seconds
+POOL_SIZE = 16
+
+# 429/503 mean the request was not processed, so any method may retry.
+# Other 5xx may have partially applied, so only idempotent methods retry them.
+ALWAYS_RETRY_STATUSES = {429, 503}
+IDEMPOTENT_RETRY_STATUSES = {500, 502, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+SEARCH_PAGE_SIZE = 100  # Jira Cloud caps pages at 100 when specific fields are requested (5000 for ids/keys only)
+
+ISSUE_KEY_SEGMENT = re.compile(r"/[A-Z][A-Z0-9_]+-\d+(?=/|$)")
+NUMERIC_SEGMENT = re.compile(r"(?<!/api)(?<!/agile)/\d+(?=/|$)")  # Keep API version segments
+
+
+def endpoint_name(method, path):
+    """Group metrics by route, e.g. 'POST /rest/api/3/issue/{key}/transitions'."""
+    path = ISSUE_KEY_SEGMENT.sub("/{key}", path.split("?", 1)[0])
+    return f"{method} {NUMERIC_SEGMENT.sub('/{id}', path)}"
+
+
+def retry_after_seconds(response):
+    """Parse a Retry-After header given in seconds or as an HTTP date; None if absent."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def _never_sent(error):
+    """
+    True when a request failed before any bytes reached Jira: a connect timeout, a refused
+    connection or a DNS failure. Read timeouts and dropped connections may have been processed.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.ReadTimeout) or not isinstance(error, requests.ConnectionError):
+        return False
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)  # urllib3's MaxRetryError wraps the underlying error
+    return isinstance(reason, NewConnectionError)
+
+
+class JiraSearchError(RuntimeError):
+    """A search page request failed; raised instead of silently returning partial results."""
+
+
+class JiraClient:
+    """
+    Shared keep-alive session for Jira calls with connect/read timeouts,
+    exponential-backoff retries on 429/5xx that honor Retry-After, and
+    per-endpoint request counts and latency.
+    Responses are returned as-is once retries are exhausted, so callers keep
+    checking status codes as before.
+    """
+
+    def __init__(self, base_url, auth=None, headers=None, timeout=DEFAULT_TIMEOUT,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF,
+                 pool_size=POOL_SIZE):
+        self.base_url = (base_url or "").rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.headers.update(headers or {"Accept": "application/json", "Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self.rate_limiter = None  # Optional shared limiter with acquire() and pause(seconds)
+
+    # ---------------------------------------------------------------- Requests
+
+    def _delay(self, attempt, response=None):
+        retry_after = retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        delay = min(self.backoff * (2 ** attempt), self.max_backoff)
+        return delay * random.uniform(0.5, 1.0)  # Jitter so concurrent callers don't retry in lockstep
+
+    def _should_retry(self, method, status_code):
+        if status_code in ALWAYS_RETRY_STATUSES:
+            return True
+        return status_code in IDEMPOTENT_RETRY_STATUSES and method in IDEMPOTENT_METHODS
+
+    def request(self, method, path, **kwargs):
+        """Send a request to `base_url + path` (or an absolute URL), retrying transient failures."""
+        method = method.upper()
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        endpoint = endpoint_name(method, path if not path.startswith("http") else requests.utils.urlparse(path).path)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # A failed connect never reached Jira; other errors are only safe to repeat when idempotent
+                retryable = _never_sent(e) or method in IDEMPOTENT_METHODS
+                self._record(endpoint, time.perf_counter() - start, error=True, retried=retryable and attempt < self.max_retries)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                time.sleep(self._delay(attempt))
+                attempt += 1
+                continue
+
+            retry = self._should_retry(method, response.status_code) and attempt < self.max_retries
+            self._record(endpoint, time.perf_counter() - start, error=response.status_code >= 400, retried=retry,
+                         throttled=response.status_code == 429)
+            if not retry:
+                return response
+            delay = self._delay(attempt, response)
+            if response.status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.pause(delay)  # Throttle every worker sharing the limiter, not just this one
+            print(f"⚠️ {endpoint} returned {response.status_code}; retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{self.max_retries})")
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    # ---------------------------------------------------------------- Search
+
+    def search(self, jql, fields=("summary",), page_size=SEARCH_PAGE_SIZE, limit=None):
+        """
+        Lazily yield every issue matching `jql` from /rest/api/3/search/jql.
+        Only `fields` are requested (issue key and id always come back). Pages are
+        fetched on demand with nextPageToken, so breaking out of the loop or
+        setting `limit` stops further requests. Raises JiraSearchError on failure.
+        """
+        params = {"jql": jql, "fields": ",".join(fields), "maxResults": page_size}
+        yielded = 0
+        while True:
+            if limit is not None:
+                params["maxResults"] = min(page_size, limit - yielded)
+            response = self.get("/rest/api/3/search/jql", params=params)
+            if response.status_code != 200:
+                raise JiraSearchError(f"Search failed ({response.status_code}) for '{jql}': {response.text[:300]}")
+
+            body = response.json()
+            for issue in body.get("issues", []):
+                yield issue
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+            token = body.get("nextPageToken")
+            if body.get("isLast", token is None) or not token:
+                return
+            params["nextPageToken"] = token
+
+    # ---------------------------------------------------------------- Metrics
+
+    def _record(self, endpoint, seconds, error=False, retried=False, throttled=False):
+        with self._lock:
+            stats = self._metrics.setdefault(endpoint, {
+                "requests": 0, "errors": 0, "retries": 0, "throttled": 0, "total_seconds": 0.0, "max_seconds": 0.0
+            })
+            stats["requests"] += 1
+            stats["errors"] += int(error)
+            stats["retries"] += int(retried)
+            stats["throttled"] += int(throttled)
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def metrics(self):
+        """Per-endpoint request counts and latency (seconds), including average latency."""
+        with self._lock:
+            return {
+                endpoint: {**stats, "avg_seconds": stats["total_seconds"] / stats["requests"]}
+                for endpoint, stats in self._metrics.items()
+            }
+
+    def report_metrics(self):
+        """Print a per-endpoint summary of requests, retries and latency."""
+        for endpoint, stats in sorted(self.metrics().items()):
+            print(f"📊 {endpoint:<55} {stats['requests']:5} req  {stats['retries']:3} retried  "
+                  f"{stats['errors']:3} errors  avg {stats['avg_seconds'] * 1000:7.1f} ms  "
+                  f"max {stats['max_seconds'] * 1000:7.1f} ms")
@@ -1,5 +1,6 @@
 import os
 import sys
+import re
 import json
 import requests
 
@@ -24,6 +25,8 @@ if src_dir not in sys.path:
 from modules.utils.path_manager import PATHS
 from modules.security.jira_secrets import get_secret
 from modules.security.security_manager import SECURITY_MANAGER  # ✅ Use centralized security
+from jira_client import JiraClient, JiraSearchError
+from jira_scheduler import JiraScheduler
 
 # Retrieve Jira credentials from AWS Secrets Manager
 secret_name = "BN-Jira-Credentials"
@@ -47,25 +50,41 @@ HEADERS = {
 
 JIRA_AUTH = (JIRA_EMAIL, JIRA_API_TOKEN)
 
+# ✅ Shared keep-alive client: timeouts, retries on 429/5xx and per-endpoint metrics
+JIRA_CLIENT = JiraClient(JIRA_BASE_URL, auth=JIRA_AUTH, headers=HEADERS)
+SLACK_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
 # ----------------------------------------------
 # 🚀 Section 2: Issue Creation Functions
 # ----------------------------------------------
-def create_jira_issue(issue_type_id, title, description, fields=None):
-    """Creates a Jira issue with validated fields."""
-    issue_data = {
-        "fields": {
-            "project": {"key": JIRA_PROJECT_KEY},  # ✅ Ensuring correct project key
-            "summary": title,
-            "description": description,
-            "issuetype": {"id": issue_type_id},  # ✅ Using ID to avoid name mismatch
-            "customfield_10036": 1  # ✅ Default Story Points (modify as needed)
-        }
+ISSUE_TYPE_IDS = {
+    "Initiative": "10012",
+    "Epic": "10000",
+    "Story": "10001",
+    "Task": "10002",
+    "Sub-task": "10003",
+}
+BULK_CREATE_LIMIT = 50  # Jira Cloud accepts at most 50 issues per bulk request
+
+def build_issue_fields(issue_type_id, title, description, fields=None):
+    """Build the create payload fields for one issue."""
+    issue_fields = {
+        "project": {"key": JIRA_PROJECT_KEY},  # ✅ Ensuring correct project key
+        "summary": title,
+        "description": description,
+        "issuetype": {"id": issue_type_id},  # ✅ Using ID to avoid name mismatch
+        "customfield_10036": 1  # ✅ Default Story Points (modify as needed)
     }
 
     if fields:
-        issue_data["fields"].update(fields)  # ✅ Merge any additional fields
+        issue_fields.update(fields)  # ✅ Merge any additional fields
+    return issue_fields
 
-    response = requests.post(f"{JIRA_BASE_URL}/rest/api/3/issue", headers=HEADERS, auth=JIRA_AUTH, json=issue_data)
+def create_jira_issue(issue_type_id, title, description, fields=None):
+    """Creates a Jira issue with validated fields."""
+    issue_data = {"fields": build_issue_fields(issue_type_id, title, description, fields)}
+
+    response = JIRA_CLIENT.post("/rest/api/3/issue", json=issue_data)
 
     if response.status_code == 201:
         issue_key = response.json().get("key")
@@ -75,6 +94,92 @@ def create_jira_issue(issue_type_id, title, description, fields=None):
         print(f"❌ Failed to create Issue {issue_type_id}: {title} | Error: {response.text}")
         return None
 
+def bulk_create_issues(issue_fields_list):
+    """
+    Create issues with /rest/api/3/issue/bulk in chunks of BULK_CREATE_LIMIT.
+    Returns (keys, errors): keys[i] is the new key for issue_fields_list[i] or None,
+    and errors maps a failed index to Jira's error message.
+    """
+    keys = [None] * len(issue_fields_list)
+    errors = {}
+
+    for offset in range(0, len(issue_fields_list), BULK_CREATE_LIMIT):
+        chunk = issue_fields_list[offset:offset + BULK_CREATE_LIMIT]
+        response = JIRA_CLIENT.post("/rest/api/3/issue/bulk", json={"issueUpdates": [{"fields": f} for f in chunk]})
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+
+        # A 400 can still carry the issues that were created; failures are reported by element number
+        failed = {}
+        for error in body.get("errors", []):
+            element_errors = error.get("elementErrors", {})
+            message = "; ".join(element_errors.get("errorMessages", []) +
+                                [f"{field}: {text}" for field, text in element_errors.get("errors", {}).items()])
+            failed[error.get("failedElementNumber")] = message or f"HTTP {error.get('status')}"
+
+        created = iter(body.get("issues", []))
+        for position in range(len(chunk)):
+            if position in failed:
+                errors[offset + position] = failed[position]
+                continue
+            issue = next(created, None)
+            if issue is None:
+                errors[offset + position] = f"HTTP {response.status_code}: {response.text[:200]}"
+            else:
+                keys[offset + position] = issue.get("key")
+
+    return keys, errors
+
+def create_issue_hierarchy(nodes, parent_key=None):
+    """
+    Create a whole Epic/Story/Task tree with one bulk request per level (per 50 issues).
+    Each node is {"type": "Epic"|"Story"|"Task"|"Sub-task", "title", "description",
+    optional "fields", optional "children": [...]}. Children are created once their
+    parent's key is known; children of a failed parent are skipped and reported.
+    Nodes are annotated in place with "key". Returns a report of created keys,
+    failures and round trips.
+    """
+    report = {"created": 0, "failures": [], "requests": 0}
+    level = [(node, parent_key, node["title"]) for node in nodes]
+
+    while level:
+        ready, next_level = [], []
+        for node, parent, path in level:
+            if parent is False:
+                report["failures"].append({"path": path, "error": "Parent issue was not created"})
+                next_level.extend((child, False, f"{path} / {child['title']}") for child in node.get("children", []))
+                continue
+            ready.append((node, parent, path))
+
+        fields_list = []
+        for node, parent, _ in ready:
+            extra = dict(node.get("fields") or {})
+            if parent:
+                extra["parent"] = {"key": parent}
+            fields_list.append(build_issue_fields(ISSUE_TYPE_IDS[node["type"]], node["title"],
+                                                  node.get("description", ""), extra))
+
+        keys, errors = bulk_create_issues(fields_list) if fields_list else ([], {})
+        report["requests"] += -(-len(fields_list) // BULK_CREATE_LIMIT)
+
+        for index, (node, _, path) in enumerate(ready):
+            node["key"] = keys[index]
+            if keys[index]:
+                report["created"] += 1
+                print(f"✅ Created {node['type']}: {node['title']} ({keys[index]})")
+            else:
+                report["failures"].append({"path": path, "error": errors.get(index)})
+                print(f"❌ Failed to create {node['type']}: {node['title']} | Error: {errors.get(index)}")
+            next_level.extend((child, keys[index] or False, f"{path} / {child['title']}")
+                              for child in node.get("children", []))
+        level = next_level
+
+    print(f"🚀 Created {report['created']} issues in {report['requests']} bulk requests "
+          f"({len(report['failures'])} failures)")
+    return report
+
 # 🚀 Create Specific Issue Types
 def create_jira_initiative(title, description):
     return create_jira_issue("10012", title, description)  # ✅ Initiative ID
@@ -106,16 +211,32 @@ def create_jira_subtask(title, description, task_key):
 # 🚀 Section 3: Epic, Story, Task Retrieval Functions
 # ----------------------------------------------
 
+def search_issues(jql, fields=("summary",), limit=None):
+    """Lazily page through every issue matching `jql`, requesting only `fields`."""
+    return JIRA_CLIENT.search(jql, fields=fields, limit=limit)
+
+
+def _summaries_to_keys(jql, failure_message):
+    """Map summary -> key over all result pages; prints and returns {} on failure."""
+    try:
+        return {issue["fields"]["summary"]: issue["key"] for issue in search_issues(jql, fields=["summary"])}
+    except JiraSearchError as e:
+        print(f"❌ {failure_message}: {e}")
+        return {}
+
+
 def get_epic_key(epic_name):
     """Retrieve the Jira issue key for an Epic based on its summary."""
-    search_url = f"{JIRA_BASE_URL}/rest/api/3/search"
     jql_query = f'project = "{JIRA_PROJECT_KEY}" AND issuetype = "Epic" AND summary ~ "{epic_name}"'
-    payload = {"jql": jql_query, "fields": ["key"]}
 
-    response = requests.get(search_url, headers=HEADERS, auth=JIRA_AUTH, json=payload)
-    
-    if response.status_code == 200 and response.json()["issues"]:
-        return response.json()["issues"][0]["key"]
+    try:
+        epic = next(search_issues(jql_query, fields=["summary"], limit=1), None)  # ✅ Stops after the first match
+    except JiraSearchError as e:
+        print(f"❌ {e}")
+        epic = None
+
+    if epic:
+        return epic["key"]
     else:
         print(f"❌ Epic '{epic_name}' not found in Jira!")
         return None
@@ -123,46 +244,88 @@ def get_epic_key(epic_name):
 
 def get_stories_under_epic(epic_key):
     """Retrieve all Story issue keys under an Epic."""
-    search_url = f"{JIRA_BASE_URL}/rest/api/3/search"
     jql_query = f'project = "{JIRA_PROJECT_KEY}" AND "Epic Link" = "{epic_key}" AND issuetype = "Story"'
-    payload = {"jql": jql_query, "fields": ["key", "summary"]}
-
-    response = requests.get(search_url, headers=HEADERS, auth=JIRA_AUTH, json=payload)
+    return _summaries_to_keys(jql_query, f"Failed to retrieve stories under Epic {epic_key}")
 
-    if response.status_code == 200:
-        return {issue["fields"]["summary"]: issue["key"] for issue in response.json()["issues"]}
-    else:
-        print(f"❌ Failed to retrieve stories under Epic {epic_key}: {response.json()}")
-        return {}
-    
 def get_tasks_under_story(story_key):
     """Retrieve all Task issue keys under a Story."""
-    search_url = f"{JIRA_BASE_URL}/rest/api/3/search"
     jql_query = f'project = "{JIRA_PROJECT_KEY}" AND "parent" = "{story_key}" AND issuetype = "Task"'
-    payload = {"jql": jql_query, "fields": ["key", "summary"]}
-
-    response = requests.get(search_url, headers=HEADERS, auth=JIRA_AUTH, json=payload)
-
-    if response.status_code == 200:
-        return {issue["fields"]["summary"]: issue["key"] for issue in response.json()["issues"]}
-    else:
-        print(f"❌ Failed to retrieve tasks under Story {story_key}: {response.json()}")
-        return {}
+    return _summaries_to_keys(jql_query, f"Failed to retrieve tasks under Story {story_key}")
 
 
 def get_subtasks_under_task(task_key):
     """Retrieve all Subtask issue keys under a Task."""
-    search_url = f"{JIRA_BASE_URL}/rest/api/3/search"
     jql_query = f'project = "{JIRA_PROJECT_KEY}" AND "parent" = "{task_key}" AND issuetype = "Sub-task"'
-    payload = {"jql": jql_query, "fields": ["key", "summary"]}
+    return _summaries_to_keys(jql_query, f"Failed to retrieve subtasks under Task {task_key}")
+
+
+MAX_JQL_LENGTH = 4000  # Characters; keeps the encoded GET URL well under common 8 KB limits
+HIERARCHY_FIELDS = ["summary", "issuetype", "status", "parent"]
+
+
+def _parent_in_queries(parent_keys, max_length=MAX_JQL_LENGTH):
+    """Yield 'parent in (...)' JQL strings covering `parent_keys`, each within `max_length`."""
+    prefix = f'project = "{JIRA_PROJECT_KEY}" AND parent in ('
+    chunk = []
+    for key in parent_keys:
+        if chunk and len(prefix) + len(", ".join(chunk + [key])) + 1 > max_length:
+            yield prefix + ", ".join(chunk) + ")"
+            chunk = []
+        chunk.append(key)
+    if chunk:
+        yield prefix + ", ".join(chunk) + ")"
+
+
+def fetch_hierarchy(epic, max_depth=4):
+    """
+    Fetch an Epic and everything beneath it (Stories, Tasks, Sub-tasks) with one
+    batched 'parent in (...)' search per level instead of one search per node.
+    `epic` is an issue key or an Epic summary. Returns a nested dict
+    {"key", "summary", "type", "status", "children": [...]}, or None if the Epic
+    can't be found. Requests scale with depth (and page count), not node count.
+    """
+    epic_key = epic if re.fullmatch(r"[A-Z][A-Z0-9_]+-\d+", epic) else get_epic_key(epic)
+    if not epic_key:
+        return None
 
-    response = requests.get(search_url, headers=HEADERS, auth=JIRA_AUTH, json=payload)
+    def node(issue):
+        fields = issue.get("fields") or {}
+        return {
+            "key": issue["key"],
+            "summary": fields.get("summary"),
+            "type": (fields.get("issuetype") or {}).get("name"),
+            "status": (fields.get("status") or {}).get("name"),
+            "children": [],
+        }
 
-    if response.status_code == 200:
-        return {issue["fields"]["summary"]: issue["key"] for issue in response.json()["issues"]}
-    else:
-        print(f"❌ Failed to retrieve subtasks under Task {task_key}: {response.json()}")
-        return {}
+    try:
+        root = next(search_issues(f'key = "{epic_key}"', fields=HIERARCHY_FIELDS, limit=1), None)
+    except JiraSearchError as e:
+        print(f"❌ Failed to fetch Epic {epic_key}: {e}")
+        return None
+    root = node(root) if root else {"key": epic_key, "summary": None, "type": "Epic", "status": None, "children": []}
+
+    nodes = {epic_key: root}
+    level, depth, searches = [epic_key], 0, 0
+    while level and depth < max_depth:
+        next_level = []
+        for jql_query in _parent_in_queries(level):
+            searches += 1
+            try:
+                for issue in search_issues(jql_query, fields=HIERARCHY_FIELDS):
+                    parent_key = ((issue.get("fields") or {}).get("parent") or {}).get("key")
+                    if parent_key in nodes and issue["key"] not in nodes:
+                        nodes[issue["key"]] = node(issue)
+                        nodes[parent_key]["children"].append(nodes[issue["key"]])
+                        if nodes[issue["key"]]["type"] != "Sub-task":  # Sub-tasks are always leaves
+                            next_level.append(issue["key"])
+            except JiraSearchError as e:
+                print(f"❌ Failed to fetch level {depth + 1} of {epic_key}: {e}")
+        level = next_level
+        depth += 1
+
+    print(f"✅ Fetched {len(nodes)} issues under {epic_key} with {searches + 1} searches ({depth} levels)")
+    return root
 
 
 # ----------------------------------------------
@@ -177,28 +340,42 @@ def link_issues(issue_key_1, issue_key_2, link_type="Relates"):
         "outwardIssue": {"key": issue_key_2},
     }
 
-    response = requests.post(f"{JIRA_BASE_URL}/rest/api/3/issueLink", headers=HEADERS, auth=JIRA_AUTH, json=link_payload)
+    response = JIRA_CLIENT.post("/rest/api/3/issueLink", json=link_payload)
 
     if response.status_code == 201:
         print(f"✅ Linked {issue_key_1} and {issue_key_2} ({link_type})")
+        return True
     else:
         print(f"❌ Failed to link issues: {response.text}")
+        return False
 
 
 def update_jira_issue_status(issue_key, new_status):
     """Update the status of a Jira issue."""
-    update_url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/transitions"
+    update_url = f"/rest/api/3/issue/{issue_key}/transitions"
 
     transition_payload = {
         "transition": {"id": new_status}
     }
 
-    response = requests.post(update_url, headers=HEADERS, auth=JIRA_AUTH, json=transition_payload)
+    response = JIRA_CLIENT.post(update_url, json=transition_payload)
 
     if response.status_code == 204:
         print(f"✅ Updated Jira Issue: {issue_key} to {new_status}")
+        return True
     else:
         print(f"❌ Failed to update Jira Issue {issue_key}: {response.text}")
+        return False
+
+
+def create_jira_scheduler(**kwargs):
+    """
+    Scheduler bound to the shared Jira client, for running links, transitions
+    and creates concurrently, e.g.:
+        scheduler.add("story", lambda deps: create_jira_story(title, desc, epic_key))
+        scheduler.add("start", lambda deps: update_jira_issue_status(deps["story"], "21"), ["story"])
+    """
+    return JiraScheduler(JIRA_CLIENT, **kwargs)
 
 
 # ----------------------------------------------
@@ -224,7 +401,7 @@ def send_slack_notification(message):
     """Sends a Slack notification when a Jira update occurs."""
     slack_webhook_url = "YOUR_SLACK_WEBHOOK_URL"
     payload = {"text": message}
-    response = requests.post(slack_webhook_url, json=payload)
+    response = requests.post(slack_webhook_url, json=payload, timeout=SLACK_TIMEOUT)
     
     if response.status_code == 200:
         print("✅ Slack Notification Sent")
@@ -0,0 +1,302 @@
+import os
+import sys
+import csv
+import json
+import hashlib
+import uuid
+
+import numpy as np
+
+# ✅ Dynamically add the project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up two levels
+sys.path.append(project_root)
+
+from modules.utils.path_manager import PATHS
+from modules.best_practices.ats_optimization import tokenize, resume_to_text, load_job_descriptions
+from modules.file_management.huntr_store import job_id_columns, row_job_id
+
+"""
+job_index.py
+Persistent BM25 inverted index over tracked Huntr job postings.
+Postings are stored as flat NumPy arrays and opened memory-mapped, so worker
+processes share one copy through the page cache. Updates only re-tokenize
+jobs whose text changed since the last export and only touch their postings.
+"""
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+MATCH_SECTIONS = ("Skills", "Work Experience", "Experience")
+CSV_TEXT_KEYWORDS = ("title", "company", "description")
+
+ARRAY_NAMES = (
+    "doc_offsets", "doc_terms", "doc_tfs",          # Forward index (per job), used for incremental updates
+    "term_offsets", "post_docs", "post_tfs",        # Inverted index (per term), used for queries
+    "doc_lengths"
+)
+
+
+def load_huntr_csv_jobs(csv_path=None):
+    """
+    Read (job_id, text) pairs from a Huntr CSV export, joining title/company/description columns.
+    Job IDs are derived the same way as in the Huntr store, so they stay stable across exports.
+    """
+    with open(csv_path or PATHS["huntr_csv"], "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames or []
+        id_column, fallback_columns = job_id_columns(columns)
+        text_columns = [column for column in columns
+                        if any(keyword in column.lower() for keyword in CSV_TEXT_KEYWORDS)]
+        return [(str(row_job_id(row, id_column, fallback_columns)),
+                 "\n".join(row[column] for column in text_columns if row.get(column)))
+                for row in reader]
+
+
+def _text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class JobIndex:
+    """BM25 index of job postings, persisted to `index_dir` and loaded memory-mapped."""
+
+    def __init__(self, index_dir=None, k1=BM25_K1, b=BM25_B):
+        self.index_dir = index_dir or PATHS["job_index_dir"]
+        self.k1 = k1
+        self.b = b
+        self.vocabulary = {}
+        self.job_ids = []
+        self.hashes = []
+        self.arrays = {
+            "doc_offsets": np.zeros(1, dtype=np.int64),
+            "doc_terms": np.zeros(0, dtype=np.int32),
+            "doc_tfs": np.zeros(0, dtype=np.int32),
+            "term_offsets": np.zeros(1, dtype=np.int64),
+            "post_docs": np.zeros(0, dtype=np.int32),
+            "post_tfs": np.zeros(0, dtype=np.int32),
+            "doc_lengths": np.zeros(0, dtype=np.int32)
+        }
+        self._idf = np.zeros(0, dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+
+    # ---------------------------------------------------------------- Persistence
+
+    @classmethod
+    def load(cls, index_dir=None, attempts=3):
+        """Open a saved index memory-mapped; returns an empty index if none exists yet."""
+        index = cls(index_dir)
+        meta_path = os.path.join(index.index_dir, "meta.json")
+        for attempt in range(attempts):
+            if not os.path.exists(meta_path):
+                return index
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            try:
+                arrays = {
+                    name: np.load(os.path.join(index.index_dir, f"{meta['generation']}.{name}.npy"), mmap_mode="r")
+                    for name in ARRAY_NAMES
+                }
+                break
+            except FileNotFoundError:
+                # A concurrent save() swapped meta.json and pruned this generation; re-read it
+                if attempt == attempts - 1:
+                    raise
+
+        index.k1, index.b = meta["k1"], meta["b"]
+        index.vocabulary = {term: term_id for term_id, term in enumerate(meta["terms"])}
+        index.job_ids = meta["job_ids"]
+        index.hashes = meta["hashes"]
+        index.arrays = arrays
+        index._prepare_scoring()
+        return index
+
+    def save(self):
+        """
+        Write a new generation of arrays, then atomically swap meta.json to point at it.
+        The previous generation is kept for readers that loaded the old meta.json;
+        only older ones are pruned.
+        """
+        os.makedirs(self.index_dir, exist_ok=True)
+        meta_path = os.path.join(self.index_dir, "meta.json")
+        previous = None
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                previous = json.load(f).get("generation")
+
+        generation = uuid.uuid4().hex[:12]
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(self.index_dir, f"{generation}.{name}.npy"), np.asarray(self.arrays[name]))
+
+        meta = {
+            "generation": generation,
+            "previous_generation": previous,
+            "k1": self.k1,
+            "b": self.b,
+            "terms": list(self.vocabulary),
+            "job_ids": self.job_ids,
+            "hashes": self.hashes
+        }
+        temp_path = os.path.join(self.index_dir, f"meta.json.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(temp_path, meta_path)
+
+        keep = {generation, previous}
+        for filename in os.listdir(self.index_dir):
+            if filename.endswith(".npy") and filename.split(".", 1)[0] not in keep:
+                try:
+                    os.remove(os.path.join(self.index_dir, filename))
+                except OSError as e:
+                    # Still memory-mapped somewhere (Windows refuses to delete it); retry on the next save
+                    print(f"⚠️ Could not remove old index file {filename}: {e}")
+
+    # ---------------------------------------------------------------- Updates
+
+    def update(self, jobs):
+        """
+        Sync the index with the full current list of (job_id, text) pairs.
+        New and changed jobs are tokenized, unchanged ones keep their stored
+        postings, and jobs missing from `jobs` are dropped.
+        Returns a summary of added, changed, removed and unchanged counts.
+        """
+        previous = {job_id: position for position, job_id in enumerate(self.job_ids)}
+        keep_docs = np.zeros(len(self.job_ids), dtype=bool)
+
+        new_ids, new_hashes, term_rows, tf_rows = [], [], [], []
+        summary = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+        for job_id, text in dict(jobs).items():
+            text_hash = _text_hash(text)
+            position = previous.pop(job_id, None)
+            if position is not None and self.hashes[position] == text_hash:
+                keep_docs[position] = True
+                summary["unchanged"] += 1
+                continue
+            term_ids = [self.vocabulary.setdefault(token, len(self.vocabulary)) for token in tokenize(text)]
+            terms, tfs = np.unique(np.asarray(term_ids, dtype=np.int32), return_counts=True)
+            term_rows.append(terms.astype(np.int32))
+            tf_rows.append(tfs.astype(np.int32))
+            new_ids.append(job_id)
+            new_hashes.append(text_hash)
+            summary["changed" if position is not None else "added"] += 1
+        summary["removed"] = len(previous)
+
+        # Unchanged jobs keep their relative order; changed and new jobs are re-added at the end
+        kept = np.flatnonzero(keep_docs)
+        self.job_ids = [self.job_ids[position] for position in kept] + new_ids
+        self.hashes = [self.hashes[position] for position in kept] + new_hashes
+        self._apply_changes(keep_docs, term_rows, tf_rows)
+        return summary
+
+    def _apply_changes(self, keep_docs, term_rows, tf_rows):
+        """
+        Drop the postings of removed and changed jobs and add those of the re-tokenized ones.
+        Unchanged postings are copied, never re-sorted: new jobs get the highest doc ids, so
+        their postings are inserted at the end of each term's list, keeping doc ids ascending.
+        """
+        doc_offsets = np.asarray(self.arrays["doc_offsets"])
+        term_offsets = np.asarray(self.arrays["term_offsets"])
+        post_docs = np.asarray(self.arrays["post_docs"])
+        n_kept, n_terms = int(keep_docs.sum()), len(self.vocabulary)
+        remap = (np.cumsum(keep_docs) - 1).astype(np.int32)
+
+        new_lengths = np.array([len(row) for row in term_rows], dtype=np.int64)
+        new_terms = np.concatenate(term_rows) if term_rows else np.zeros(0, dtype=np.int32)
+        new_tfs = np.concatenate(tf_rows) if tf_rows else np.zeros(0, dtype=np.int32)
+        new_docs = np.repeat(np.arange(n_kept, n_kept + len(term_rows), dtype=np.int32), new_lengths)
+
+        # Forward index: unchanged rows in order, then the new rows
+        old_lengths = np.diff(doc_offsets)
+        entry_keep = np.repeat(keep_docs, old_lengths)
+        row_lengths = np.concatenate((old_lengths[keep_docs], new_lengths))
+
+        # Inverted index: filter the kept postings, then splice the new ones in per term
+        post_keep = keep_docs[post_docs]
+        post_terms = np.repeat(np.arange(len(term_offsets) - 1, dtype=np.int32), np.diff(term_offsets))[post_keep]
+        kept_counts = np.bincount(post_terms, minlength=n_terms)
+        order = np.argsort(new_terms, kind="stable")
+        insert_at = np.cumsum(kept_counts)[new_terms[order]] if len(order) else np.zeros(0, dtype=np.int64)
+        term_counts = kept_counts + np.bincount(new_terms, minlength=n_terms)
+
+        self.arrays = {
+            "doc_offsets": np.concatenate(([0], np.cumsum(row_lengths))).astype(np.int64),
+            "doc_terms": np.concatenate((np.asarray(self.arrays["doc_terms"])[entry_keep], new_terms)).astype(np.int32),
+            "doc_tfs": np.concatenate((np.asarray(self.arrays["doc_tfs"])[entry_keep], new_tfs)).astype(np.int32),
+            "term_offsets": np.concatenate(([0], np.cumsum(term_counts))).astype(np.int64),
+            "post_docs": np.insert(remap[post_docs[post_keep]], insert_at, new_docs[order]).astype(np.int32),
+            "post_tfs": np.insert(np.asarray(self.arrays["post_tfs"])[post_keep], insert_at, new_tfs[order]).astype(np.int32),
+            "doc_lengths": np.concatenate((np.asarray(self.arrays["doc_lengths"])[keep_docs],
+                                           [int(tfs.sum()) for tfs in tf_rows])).astype(np.int32)
+        }
+        self._prepare_scoring()
+
+    def _prepare_scoring(self):
+        """Precompute IDF per term and the BM25 length normalisation per job."""
+        n_docs = len(self.job_ids)
+        document_frequency = np.diff(self.arrays["term_offsets"]).astype(np.float32)
+        self._idf = np.log1p((n_docs - document_frequency + 0.5) / (document_frequency + 0.5)).astype(np.float32)
+        doc_lengths = np.asarray(self.arrays["doc_lengths"], dtype=np.float32)
+        average_length = doc_lengths.mean() if n_docs and doc_lengths.mean() > 0 else 1.0
+        self._norms = (self.k1 * (1 - self.b + self.b * doc_lengths / average_length)).astype(np.float32)
+
+    # ---------------------------------------------------------------- Queries
+
+    def search(self, text, top_k=10):
+        """Return the top-K (job_id, score) pairs for free text, best first."""
+        term_ids = [self.vocabulary[token] for token in tokenize(text) if token in self.vocabulary]
+        if not term_ids or not self.job_ids:
+            return []
+
+        offsets = self.arrays["term_offsets"]
+        scores = np.zeros(len(self.job_ids), dtype=np.float32)
+        query_terms, query_tfs = np.unique(term_ids, return_counts=True)
+        for term_id, query_tf in zip(query_terms, query_tfs):
+            start, end = offsets[term_id], offsets[term_id + 1]
+            if start == end:
+                continue
+            docs = self.arrays["post_docs"][start:end]
+            tfs = np.asarray(self.arrays["post_tfs"][start:end], dtype=np.float32)
+            scores[docs] += query_tf * self._idf[term_id] * tfs * (self.k1 + 1) / (tfs + self._norms[docs])
+
+        top_k = min(top_k, int(np.count_nonzero(scores)))
+        if top_k <= 0:
+            return []
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        return [(self.job_ids[doc], round(float(scores[doc]), 4)) for doc in best]
+
+    def match_resume(self, resume_data, top_k=10, sections=MATCH_SECTIONS):
+        """Top-K jobs for a resume's Skills/Experience sections (falls back to the whole resume)."""
+        text = resume_to_text([resume_data[section] for section in sections if section in resume_data])
+        return self.search(text or resume_to_text(resume_data), top_k)
+
+    def __len__(self):
+        return len(self.job_ids)
+
+
+def update_job_index(index_dir=None, csv_path=None, job_description_path=None):
+    """Refresh the saved index from the latest Huntr exports and persist it."""
+    jobs = {}
+    job_description_path = job_description_path or PATHS["job_description_file"]
+    csv_path = csv_path or PATHS["huntr_csv"]
+    if os.path.exists(csv_path):
+        jobs.update(load_huntr_csv_jobs(csv_path))
+    if os.path.exists(job_description_path):
+        jobs.update(load_job_descriptions(job_description_path))
+
+    index = JobIndex.load(index_dir)
+    summary = index.update(jobs.items())
+    index.save()
+    print(f"✅ Job index updated: {summary['added']} added, {summary['changed']} changed, "
+          f"{summary['removed']} removed, {summary['unchanged']} unchanged")
+    return index
+
+
+if __name__ == "__main__":
+    index = update_job_index()
+    resume_path = PATHS["structured_json"]
+    if os.path.exists(resume_path):
+        with open(resume_path, "r", encoding="utf-8") as f:
+            resume = json.load(f)
+        for job_id, score in index.match_resume(resume, top_k=10):
+            print(f"{score:8.3f}  {job_id}")
+    else:
+        print(f"✅ {len(index)} jobs indexed in {index.index_dir}")
@@ -0,0 +1,89 @@
+import os
+import sys
+import gzip
+import json
+
+# ✅ Dynamically add the project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up two levels
+sys.path.append(project_root)
+
+from modules.utils.path_manager import PATHS
+
+"""
+jsonl_writer.py
+Append-only JSON Lines output for extraction results: one compact record per resume,
+optionally gzip-compressed, written in buffered batches and read back lazily.
+"""
+
+DEFAULT_FLUSH_EVERY = 100  # Records buffered before each write
+
+
+def _open_jsonl(path, mode):
+    """Open a JSONL file as text, transparently handling `.gz` compression."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class JsonlWriter:
+    """Buffered appender that writes one compact JSON record per line."""
+
+    def __init__(self, output_path=None, flush_every=DEFAULT_FLUSH_EVERY, compress=False):
+        output_path = output_path or PATHS["resume_output_jsonl"]
+        if compress and not output_path.endswith(".gz"):
+            output_path += ".gz"
+        self.output_path = output_path
+        self.flush_every = flush_every
+        self.records_written = 0
+        self._buffer = []
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record):
+        """Queue a record, writing the buffer once it reaches `flush_every` records."""
+        self._buffer.append(json.dumps(record, separators=(",", ":"), ensure_ascii=False))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Append buffered records to disk."""
+        if not self._buffer:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+            self._file = _open_jsonl(self.output_path, "a")
+        self._file.write("\n".join(self._buffer) + "\n")
+        self._file.flush()
+        self.records_written += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        """Flush remaining records and close the file."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def iter_jsonl(input_path=None):
+    """Lazily yield records from a JSONL (or .jsonl.gz) file, one line at a time."""
+    input_path = input_path or PATHS["resume_output_jsonl"]
+    with _open_jsonl(input_path, "r") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"⚠️ Skipping malformed record at {input_path}:{line_number}: {e}")
+
+
+if __name__ == "__main__":
+    count = sum(1 for _ in iter_jsonl(sys.argv[1] if len(sys.argv) > 1 else None))
+    print(f"✅ {count} records")
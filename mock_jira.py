@@ -0,0 +1,150 @@
+import re
+import json
+import time
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ----------------------------------------------
+# 🚀 Local mock of the Jira Cloud REST endpoints used by jira_manager
+# ----------------------------------------------
+# Supports issue create (single and bulk), links, transitions, deletes and
+# /rest/api/3/search/jql with nextPageToken paging and simple JQL filters
+# (parent in (...), parent = KEY, summary ~ "...", issuetype = "..."), plus optional
+# 429 throttling and per-request latency for exercising clients offline.
+
+ISSUE_TYPE_NAMES = {"10012": "Initiative", "10000": "Epic", "10001": "Story", "10002": "Task", "10003": "Sub-task"}
+
+
+def serve_mock_jira(throttle_every=0, latency=0.0, project_key="TR", retry_after="0.2"):
+    """
+    Start the mock on a free local port. Returns (server, base_url, state), where
+    state exposes "issues", "requests", "links", "transitions" and "throttled"
+    and "fail_summaries" (a set of summaries whose creation is rejected).
+    """
+    state = {"issues": {}, "requests": [], "links": [], "transitions": [],
+             "throttled": 0, "fail_summaries": set(), "counter": 0}
+    lock = threading.Lock()
+
+    def create_issue(fields):
+        issue_type = fields.get("issuetype", {})
+        type_name = issue_type.get("name") or ISSUE_TYPE_NAMES.get(issue_type.get("id"), "Task")
+        parent = (fields.get("parent") or {}).get("key")
+        if fields.get("summary") in state["fail_summaries"]:
+            return None, {"summary": "Rejected by mock"}
+        if parent and parent not in state["issues"]:
+            return None, {"parent": f"Issue {parent} does not exist"}
+        with lock:
+            state["counter"] += 1
+            number = state["counter"]
+        key = f"{project_key}-{number}"
+        state["issues"][key] = {"id": str(10000 + number), "key": key, "fields": {
+            "summary": fields.get("summary"), "issuetype": {"name": type_name},
+            "parent": {"key": parent} if parent else None, "status": {"name": "To Do"}}}
+        return key, None
+
+    def search(query):
+        jql = query.get("jql", [""])[0]
+        issues = list(state["issues"].values())
+        match = re.search(r'"?parent"?\s+in\s*\(([^)]*)\)', jql, re.I)
+        if match:
+            parents = {item.strip().strip('"') for item in match.group(1).split(",")}
+            issues = [i for i in issues if (i["fields"]["parent"] or {}).get("key") in parents]
+        match = re.search(r'"?parent"?\s*=\s*"?([A-Z][A-Z0-9_]+-\d+)"?', jql)
+        if match:
+            issues = [i for i in issues if (i["fields"]["parent"] or {}).get("key") == match.group(1)]
+        match = re.search(r'summary\s*~\s*"([^"]*)"', jql)
+        if match:
+            issues = [i for i in issues if match.group(1).lower() in (i["fields"]["summary"] or "").lower()]
+        match = re.search(r'issuetype\s*=\s*"([^"]*)"', jql)
+        if match:
+            issues = [i for i in issues if i["fields"]["issuetype"]["name"] == match.group(1)]
+
+        fields = query.get("fields", ["*navigable"])[0].split(",")
+        max_results = int(query.get("maxResults", ["50"])[0])
+        offset = int(query.get("nextPageToken", ["0"])[0])
+        page = issues[offset:offset + max_results]
+        body = {"issues": [{"id": i["id"], "key": i["key"],
+                            "fields": {f: v for f, v in i["fields"].items() if "*" in fields[0] or f in fields}}
+                           for i in page],
+                "isLast": offset + max_results >= len(issues)}
+        if not body["isLast"]:
+            body["nextPageToken"] = str(offset + max_results)
+        return body
+
+    class MockJiraHandler(BaseHTTPRequestHandler):
+        def _send(self, status, body=None, headers=None):
+            payload = json.dumps(body).encode("utf-8") if body is not None else b""
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _begin(self):
+            """Record the request, apply latency and throttling; True if already answered."""
+            time.sleep(latency)
+            with lock:
+                state["requests"].append((self.command, self.path))
+                throttle = throttle_every and len(state["requests"]) % throttle_every == 0
+                if throttle:
+                    state["throttled"] += 1
+            if throttle:
+                self._send(429, {"errorMessages": ["Rate limit exceeded"]}, {"Retry-After": retry_after})
+            return throttle
+
+        def _json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_POST(self):
+            if self._begin():
+                return
+            body = self._json()
+            if self.path == "/rest/api/3/issue/bulk":
+                created, errors = [], []
+                for position, update in enumerate(body.get("issueUpdates", [])):
+                    key, error = create_issue(update["fields"])
+                    if key:
+                        created.append({"id": state["issues"][key]["id"], "key": key})
+                    else:
+                        errors.append({"status": 400, "failedElementNumber": position,
+                                       "elementErrors": {"errorMessages": [], "errors": error}})
+                return self._send(201 if not errors else 400, {"issues": created, "errors": errors})
+            if self.path == "/rest/api/3/issue":
+                key, error = create_issue(body["fields"])
+                return self._send(201, {"key": key}) if key else self._send(400, {"errors": error})
+            if self.path == "/rest/api/3/issueLink":
+                state["links"].append(body)
+                return self._send(201)
+            match = re.fullmatch(r"/rest/api/3/issue/([^/]+)/transitions", self.path)
+            if match and match.group(1) in state["issues"]:
+                state["transitions"].append((match.group(1), body.get("transition", {}).get("id")))
+                return self._send(204)
+            self._send(404, {"errorMessages": ["Not found"]})
+
+        def do_GET(self):
+            if self._begin():
+                return
+            url = urllib.parse.urlparse(self.path)
+            if url.path == "/rest/api/3/search/jql":
+                return self._send(200, search(urllib.parse.parse_qs(url.query)))
+            self._send(404, {"errorMessages": ["Not found"]})
+
+        def do_DELETE(self):
+            if self._begin():
+                return
+            key = self.path.rstrip("/").rsplit("/", 1)[-1]
+            if state["issues"].pop(key, None) is None:
+                return self._send(404, {"errorMessages": ["Issue does not exist"]})
+            self._send(204)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockJiraHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", state
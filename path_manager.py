@@ -19,9 +19,15 @@ PATHS = {
     "config_dir": os.path.join(project_root, "config"),
     "logs_dir": os.path.join(project_root, "logs"),
     "output_dir": os.path.join(project_root, "output"),
+    "batch_output_dir": os.path.join(project_root, "output", "batch_extraction"),
+    "benchmark_results_dir": os.path.join(project_root, "output", "benchmarks"),
     "audit_dir": os.path.join(project_root, "data", "audit_logs"),  # ✅ Add this line
     "huntr_downloads": os.path.join(project_root, "downloads", "huntr_downloads"),  # Added this line
     "huntr_extracted": os.path.join(project_root, "data", "huntr_extracted"),  # Added this line
+    "extraction_cache_dir": os.path.join(project_root, "data", "extraction_cache"),
+    "job_index_dir": os.path.join(project_root, "data", "job_index"),
+    "industry_trends_cache": os.path.join(project_root, "data", "industry_trends_cache.json"),
+    "trend_sources": os.path.join(project_root, "config", "trend_sources.json"),
 
     # ✅ File paths
     "config_file": config_path,
@@ -30,6 +36,7 @@ PATHS = {
     "resume_pdf": os.path.join(project_root, "data", "full_cv.pdf"),
     "job_description_file": os.path.join(project_root, "data", "huntr_job_descriptions.json"),
     "huntr_csv": os.path.join(project_root, "data", "huntr_export.csv"),
+    "huntr_store": os.path.join(project_root, "data", "huntr_jobs.sqlite"),
     "full_cv": os.path.join(project_root, "data", "full_cv.docx"),
     "extracted_text": os.path.join(project_root, "data", "extracted_text.txt"),
     "validation_log": os.path.join(project_root, "logs", "validation_log.txt"),
@@ -39,7 +46,10 @@ PATHS = {
     "staging_json": os.path.join(project_root, "data", "staging.json"),
     "structured_json": os.path.join(project_root, "data", "structured.json"),
     "resume_output_json": os.path.join(project_root, "data", "resume_output_json"),
+    "resume_output_jsonl": os.path.join(project_root, "data", "resume_output.jsonl"),
     "schema_file": os.path.join(project_root, "data", "resume_schema.json"),  # ✅ Fixed for correct filename
+    "resume_schema": os.path.join(project_root, "data", "resume_schema.json"),
+    "new_sections_json": os.path.join(project_root, "data", "new_sections.json"),
 
     # ✅ OCR and Image paths
     "temp_pdf": os.path.join(project_root, "data", "resume_image_output", "temp.pdf"),
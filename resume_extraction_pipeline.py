@@ -2,10 +2,16 @@ import os
 import sys
 import json
 import re
+import time
+import bisect
+import hashlib
+import zipfile
+import xml.etree.ElementTree as ET
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pdfplumber
 import pytesseract
 from docx import Document
-from PIL import Image
 import spacy
 
 # ✅ Dynamically add the project root to sys.path
@@ -14,14 +20,39 @@ project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))  # Move up
 sys.path.append(project_root)
 
 from modules.utils.path_manager import PATHS, add_project_to_sys_path
+from modules.extraction.extraction_cache import ExtractionCache
+from modules.extraction.resume_json_standardization import SECTION_HEADER_INDEX
+from modules.extraction.jsonl_writer import JsonlWriter
+from modules.extraction.contact_extractor import first_contacts
 
-# Load NLP model
-nlp = spacy.load("en_core_web_sm")
+# NLP model is loaded lazily; only the NER pipe is needed for section classification
+NLP_MODEL = "en_core_web_sm"
+# en_core_web_sm's ner carries its own internal tok2vec, so the shared one only feeds excluded pipes
+NLP_EXCLUDED_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"]
+NLP_BATCH_SIZE = 64
+_nlp = None
 
-# Regex for structured field extraction
-EMAIL_REGEX = r"[a-zA-Z0-9+_.-]+@[a-zA-Z0-9.-]+"
-PHONE_REGEX = r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
-LINKEDIN_REGEX = r"(https?:\/\/)?([\w]+\.)?linkedin\.com\/in\/[\w-]+"
+def get_nlp():
+    """ Load the spaCy model on first use, without the components this pipeline never reads """
+    global _nlp
+    if _nlp is None:
+        _nlp = spacy.load(NLP_MODEL, exclude=NLP_EXCLUDED_COMPONENTS)
+    return _nlp
+
+
+# Bump whenever extraction output changes so cached results are invalidated
+EXTRACTOR_VERSION = "5"
+
+# Rasterization DPI for OCR of scanned pages
+OCR_RESOLUTION = 300
+
+# WordprocessingML tags read by the streaming DOCX parser
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DOCX_PARAGRAPH = WORD_NAMESPACE + "p"
+DOCX_TABLE = WORD_NAMESPACE + "tbl"
+DOCX_TEXT = WORD_NAMESPACE + "t"
+DOCX_TAB = WORD_NAMESPACE + "tab"
+DOCX_BREAKS = {WORD_NAMESPACE + "br", WORD_NAMESPACE + "cr"}
 
 def clean_extracted_text(text):
     """ Remove unwanted artifacts like page numbers or extra spacing """
@@ -29,27 +60,141 @@ def clean_extracted_text(text):
     text = re.sub(r'\n\s*\n', '\n', text)  # Remove excessive newlines
     return text.strip()
 
-def extract_text_from_pdf(pdf_path):
-    """ Extract text from PDF using pdfplumber and OCR fallback """
+def _ocr_page(page, resolution=OCR_RESOLUTION):
+    """
+    Rasterize a single pdfplumber page and OCR it, returning text and per-stage timings.
+    OCR failures (e.g. Tesseract missing) are logged and yield '' for this page only.
+    """
+    start = time.perf_counter()
+    try:
+        image = page.to_image(resolution=resolution).original
+        rasterized = time.perf_counter()
+        text = clean_extracted_text(pytesseract.image_to_string(image))
+    except Exception as e:
+        print(f"⚠️ OCR failed for page {page.page_number}: {e}")
+        return {"page": page.page_number, "text": "", "error": str(e),
+                "rasterize_seconds": 0.0, "ocr_seconds": round(time.perf_counter() - start, 4)}
+    finished = time.perf_counter()
+    return {
+        "page": page.page_number,
+        "text": text,
+        "rasterize_seconds": round(rasterized - start, 4),
+        "ocr_seconds": round(finished - rasterized, 4)
+    }
+
+def _ocr_pdf_page(task):
+    """ Pool worker: open the PDF at a single page and OCR it """
+    pdf_path, page_number, resolution = task
+    with pdfplumber.open(pdf_path, pages=[page_number]) as pdf:
+        return _ocr_page(pdf.pages[0], resolution)
+
+def ocr_pdf_pages(pdf_path, page_numbers, max_workers=None, resolution=OCR_RESOLUTION):
+    """
+    OCR the given 1-based page numbers of a PDF concurrently across processes.
+    Returns one result per page, in page order, with rasterize/OCR timings for each.
+    """
+    tasks = [(pdf_path, page_number, resolution) for page_number in sorted(page_numbers)]
+    if not tasks:
+        return []
+
+    if max_workers == 1 or len(tasks) == 1:
+        results = [_ocr_pdf_page(task) for task in tasks]
+    else:
+        workers = min(max_workers or os.cpu_count(), len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_ocr_pdf_page, tasks))
+
+    total = sum(r["rasterize_seconds"] + r["ocr_seconds"] for r in results)
+    slowest = max(results, key=lambda r: r["rasterize_seconds"] + r["ocr_seconds"])
+    failed = sum(1 for r in results if "error" in r)
+    print(f"🔍 OCR'd {len(results) - failed} page(s) of {os.path.basename(pdf_path)} "
+          f"({total:.2f}s worker time, slowest page {slowest['page']}"
+          f"{f', {failed} failed' if failed else ''}).")
+    return results
+
+def iter_pdf_pages(pdf_path, ocr_blank_pages=False):
+    """
+    Yield cleaned text page by page, releasing pdfplumber's page caches as it goes.
+    With `ocr_blank_pages`, pages without a text layer are OCR'd inline so order is preserved.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            try:
+                text = clean_extracted_text(page.extract_text() or "")
+                if not text and ocr_blank_pages:
+                    text = _ocr_page(page)["text"]
+                yield text
+            finally:
+                page.close()  # Drop parsed layout objects before moving to the next page
+
+def extract_text_from_pdf(pdf_path, ocr_workers=None):
+    """ Extract text from PDF using pdfplumber and a per-page OCR fallback for scanned pages """
     text = ""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text() or ""
-        text = clean_extracted_text(text)  # Apply cleaning
-        if not text.strip():
-            text = pytesseract.image_to_string(Image.open(pdf_path))
+        page_texts = list(iter_pdf_pages(pdf_path))
+        blank_pages = [number for number, page_text in enumerate(page_texts, start=1) if not page_text]
+        if blank_pages:
+            try:
+                for result in ocr_pdf_pages(pdf_path, blank_pages, max_workers=ocr_workers):
+                    page_texts[result["page"] - 1] = result["text"]
+            except Exception as e:
+                # ✅ Keep the text layer of the other pages if the OCR pool itself fails
+                print(f"⚠️ OCR unavailable for {os.path.basename(pdf_path)}: {e}")
+        text = "\n".join(page_text for page_text in page_texts if page_text)
     except FileNotFoundError:
         print(f"⚠️ PDF not found: {pdf_path}")
     except Exception as e:
         print(f"Error processing PDF: {e}")
     return text
 
+def iter_docx_paragraphs(docx_path):
+    """
+    Stream paragraph text straight from word/document.xml, including table cells,
+    without building the python-docx object model. Each top-level block is detached
+    from <w:body> once it closes, so memory stays bounded on long documents.
+    """
+    with zipfile.ZipFile(docx_path) as archive:
+        with archive.open("word/document.xml") as document_xml:
+            parts = []
+            ancestors = []  # ElementTree has no parent links; track open elements instead
+            for event, element in ET.iterparse(document_xml, events=("start", "end")):
+                if event == "start":
+                    ancestors.append(element)
+                    continue
+                ancestors.pop()
+
+                tag = element.tag
+                if tag == DOCX_TEXT:
+                    parts.append(element.text or "")
+                elif tag == DOCX_TAB:
+                    parts.append("\t")
+                elif tag in DOCX_BREAKS:
+                    parts.append("\n")
+                elif tag == DOCX_PARAGRAPH:
+                    yield "".join(parts)
+                    parts = []
+                    element.clear()
+
+                if len(ancestors) == 2:  # [w:document, w:body]: a finished body child
+                    ancestors[-1].remove(element)
+
+def _extract_docx_with_python_docx(docx_path):
+    """ Fallback for DOCX files the streaming parser cannot read """
+    doc = Document(docx_path)
+    lines = [para.text for para in doc.paragraphs]
+    for table in doc.tables:
+        for row in table.rows:
+            lines.extend(cell.text for cell in row.cells)
+    return "\n".join(lines)
+
 def extract_text_from_docx(docx_path):
     """ Extract text from DOCX """
     try:
-        doc = Document(docx_path)
-        text = "\n".join([para.text for para in doc.paragraphs])
+        try:
+            text = "\n".join(iter_docx_paragraphs(docx_path))
+        except (KeyError, ET.ParseError) as e:
+            print(f"⚠️ Streaming DOCX parse failed ({e}); falling back to python-docx.")
+            text = _extract_docx_with_python_docx(docx_path)
         return clean_extracted_text(text)
     except FileNotFoundError:
         print(f"⚠️ DOCX not found: {docx_path}")
@@ -58,36 +203,73 @@ def extract_text_from_docx(docx_path):
     return ""
 
 def extract_contact_info(text):
-    """ Extract email, phone, and LinkedIn profile from text """
-    def safe_search(pattern, text):
-        match = re.search(pattern, text)
-        return match.group(0).strip() if match else None  # Return `None` if no match is found
+    """ Extract the first email, phone, and LinkedIn profile from text in a single scan """
+    return first_contacts(text)
 
-    return {
-        "email": safe_search(EMAIL_REGEX, text),
-        "phone": safe_search(PHONE_REGEX, text),
-        "linkedin": safe_search(LINKEDIN_REGEX, text)
-    }
+def classify_sections(text, use_nlp=False):
+    """ Classify resume sections by header keywords, optionally refined with NLP """
+    if use_nlp:
+        return classify_sections_batch([text], use_nlp=True)[0]
+    return classify_section_lines(text.split("\n"))
 
-def classify_sections(text):
-    """ Use NLP to classify resume sections dynamically """
-    doc = nlp(text)
-    sections = {}
-    current_section = "General"
-    
-    for line in text.split("\n"):
-        if len(line.strip()) > 3:
-            if "experience" in line.lower():
-                current_section = "Experience"
-            elif "education" in line.lower():
-                current_section = "Education"
-            elif "skills" in line.lower():
-                current_section = "Skills"
-            sections.setdefault(current_section, []).append(line)
-    
+def classify_sections_batch(texts, use_nlp=False, batch_size=NLP_BATCH_SIZE):
+    """ Classify sections for many resumes, sharing one `nlp.pipe` pass when NLP is enabled """
+    sections_list = [classify_section_lines(text.split("\n")) for text in texts]
+    if use_nlp:
+        apply_nlp_sections(sections_list, batch_size=batch_size)
+    return sections_list
+
+def apply_nlp_sections(sections_list, batch_size=NLP_BATCH_SIZE):
+    """
+    Move lines naming a person out of the untitled "General" block to the top of "Header".
+    Only the General blocks are sent through `nlp.pipe`, batched across all resumes.
+    """
+    general_blocks = [sections.get("General", "") for sections in sections_list]
+    docs = get_nlp().pipe(general_blocks, batch_size=batch_size)
+
+    for index, doc in enumerate(docs):
+        sections = sections_list[index]
+        lines = general_blocks[index].split("\n")
+        line_starts = [0]
+        for line in lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+
+        header_lines = {bisect.bisect_right(line_starts, ent.start_char) - 1
+                        for ent in doc.ents if ent.label_ == "PERSON"}
+        if not header_lines:
+            continue
+
+        header = [line for number, line in enumerate(lines) if number in header_lines]
+        if sections.get("Header"):
+            header.append(sections["Header"])  # Keep contact lines already filed under a Header heading
+        general = [line for number, line in enumerate(lines) if number not in header_lines]
+        refined = {"Header": "\n".join(header)}
+        if general:
+            refined["General"] = "\n".join(general)
+        refined.update((name, content) for name, content in sections.items() if name not in ("General", "Header"))
+        sections_list[index] = refined
+
+    return sections_list
+
+def classify_sections_stream(pages):
+    """ Classify sections from an iterable of page texts without joining the whole document """
+    return classify_section_lines(line for page_text in pages for line in page_text.split("\n"))
+
+def classify_section_lines(lines):
+    """ Assign each line to the most recent section header seen in an iterable of lines """
+    sections = SECTION_HEADER_INDEX.classify_lines(lines)
     return {k: "\n".join(v) for k, v in sections.items()}
 
-def process_resume():
+_extraction_cache = None
+
+def get_extraction_cache():
+    """ Return this process's extraction cache, creating it on first use """
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache(version=EXTRACTOR_VERSION)
+    return _extraction_cache
+
+def process_resume(use_cache=True):
     """ Attempt to process both PDF and DOCX if available """
     text = ""
     pdf_path = PATHS["resume_pdf"]
@@ -95,21 +277,59 @@ def process_resume():
 
     # Try PDF first
     if os.path.exists(pdf_path):
-        print(f"✅ Processing PDF: {pdf_path}")
-        text = extract_text_from_pdf(pdf_path)
+        resume_path = pdf_path
     elif os.path.exists(docx_path):
-        print(f"✅ PDF not found. Switching to DOCX: {docx_path}")
-        text = extract_text_from_docx(docx_path)
+        resume_path = docx_path
     else:
         print("❌ No resume file found (PDF or DOCX). Exiting.")
         return None
 
+    cache = get_extraction_cache() if use_cache else None
+    cache_key = cache.key_for(resume_path) if cache else None
+    if cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            print(f"⚡ Loaded cached extraction for {resume_path}.")
+            return cached
+
+    if resume_path == pdf_path:
+        print(f"✅ Processing PDF: {pdf_path}")
+        text = extract_text_from_pdf(pdf_path)
+    else:
+        print(f"✅ PDF not found. Switching to DOCX: {docx_path}")
+        text = extract_text_from_docx(docx_path)
+
     if not text.strip():
         print("⚠️ Warning: No text extracted from the resume file.")
 
     contact_info = extract_contact_info(text)
     sections = classify_sections(text)
 
+    result = {
+        "contact_info": contact_info,
+        "sections": sections
+    }
+    if cache and text.strip():
+        cache.put(cache_key, result, source=resume_path)
+    return result
+
+def process_pdf_streaming(pdf_path):
+    """
+    Extract a PDF resume page by page so only one page is held in memory at a time.
+    Contact fields keep their first match across pages; sections are built incrementally.
+    Scanned pages are OCR'd inline, since batch workers already run one resume per core.
+    """
+    contact_info = {"email": None, "phone": None, "linkedin": None}
+
+    def pages_with_contact_scan():
+        for page_text in iter_pdf_pages(pdf_path, ocr_blank_pages=True):
+            if not all(contact_info.values()):
+                for field, value in extract_contact_info(page_text).items():
+                    contact_info[field] = contact_info[field] or value
+            yield page_text
+
+    sections = classify_sections_stream(pages_with_contact_scan())
+
     return {
         "contact_info": contact_info,
         "sections": sections
@@ -124,8 +344,215 @@ def save_to_json(data, output_path=PATHS["resume_output_json"]):
     except Exception as e:
         print(f"❌ Error saving JSON: {e}")
 
+def save_to_jsonl(data, source=None, output_path=PATHS["resume_output_jsonl"], compress=False):
+    """ Append extracted data as one compact record to a JSON Lines file """
+    try:
+        with JsonlWriter(output_path, compress=compress) as writer:
+            writer.write({"source": source, **data})
+        print(f"✅ Resume extraction complete. Appended to {writer.output_path}.")
+    except Exception as e:
+        print(f"❌ Error saving JSONL: {e}")
+
+# ----------------------------------------------
+# Batch extraction
+# ----------------------------------------------
+
+# Supported resume formats and their text extractors
+EXTRACTORS = {
+    ".pdf": extract_text_from_pdf,
+    ".docx": extract_text_from_docx,
+}
+
+def collect_resume_paths(source):
+    """ Resolve a directory or manifest file into a sorted list of resume paths """
+    if os.path.isdir(source):
+        paths = [
+            os.path.join(root, name)
+            for root, _, files in os.walk(source)
+            for name in files
+            if os.path.splitext(name)[1].lower() in EXTRACTORS
+        ]
+        return sorted(paths)
+
+    # Manifest: a JSON list of paths or one path per line
+    with open(source, "r", encoding="utf-8") as f:
+        if source.lower().endswith(".json"):
+            entries = json.load(f)
+        else:
+            entries = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    paths = [os.path.normpath(entry if os.path.isabs(entry) else os.path.join(base_dir, entry)) for entry in entries]
+    return list(dict.fromkeys(paths))  # Listing a file twice would just overwrite its own output
+
+def _common_root(paths):
+    """ Deepest directory containing every path, or None if they share none (e.g. different drives) """
+    try:
+        return os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    except ValueError:
+        return None
+
+def extract_resume_file(file_path):
+    """ Extract contact info and sections from a single PDF or DOCX resume """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in EXTRACTORS:
+        raise ValueError(f"Unsupported resume format: {extension or file_path}")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Resume not found: {file_path}")
+
+    if extension == ".pdf":
+        # Stream PDFs page by page to keep worker memory bounded
+        result = process_pdf_streaming(file_path)
+        if not result["sections"]:
+            raise ValueError("No text extracted from the resume file.")
+        return result
+
+    text = EXTRACTORS[extension](file_path)
+    if not text.strip():
+        raise ValueError("No text extracted from the resume file.")
+
+    return {
+        "contact_info": extract_contact_info(text),
+        "sections": classify_sections(text)
+    }
+
+def _init_batch_worker(use_nlp):
+    """ Load the spaCy model once per worker process when NLP classification is enabled """
+    if use_nlp:
+        get_nlp()
+
+def _process_batch_chunk(chunk):
+    """
+    Extract a chunk of resumes inside a worker; never raises.
+    Results are written to their JSON output path, or returned to the parent when it is None.
+    """
+    tasks, use_cache, use_nlp = chunk
+    cache = get_extraction_cache() if use_cache else None
+    outcomes = []
+    extracted = []
+
+    for file_path, output_path in tasks:
+        try:
+            cache_key = cache.key_for(file_path) if cache else None
+            result = cache.get(cache_key) if cache else None
+            cache_status = "hit" if result is not None else "miss"
+            if result is None:
+                result = extract_resume_file(file_path)
+                if cache:
+                    cache.put(cache_key, result, source=file_path)
+            extracted.append((file_path, output_path, result, cache_status))
+        except Exception as e:
+            outcomes.append({"source": file_path, "output": None, "status": "error", "error": f"{type(e).__name__}: {e}"})
+
+    if use_nlp and extracted:
+        # One nlp.pipe pass over the whole chunk instead of one call per resume
+        try:
+            refined = apply_nlp_sections([result["sections"] for _, _, result, _ in extracted])
+            extracted = [(file_path, output_path, {**result, "sections": sections}, cache_status)
+                         for (file_path, output_path, result, cache_status), sections in zip(extracted, refined)]
+        except Exception as e:
+            print(f"⚠️ NLP classification failed for a chunk; keeping keyword sections: {e}")
+
+    for file_path, output_path, result, cache_status in extracted:
+        if output_path is None:
+            outcomes.append({"source": file_path, "output": None, "status": "ok", "cache": cache_status, "result": result})
+            continue
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=4)
+            outcomes.append({"source": file_path, "output": output_path, "status": "ok", "cache": cache_status})
+        except Exception as e:
+            outcomes.append({"source": file_path, "output": None, "status": "error", "error": f"{type(e).__name__}: {e}"})
+
+    return outcomes
+
+def _batch_output_path(file_path, output_dir, source_root):
+    """ Map an input resume to a unique JSON output path that mirrors its relative location """
+    relative = os.path.relpath(file_path, source_root) if source_root else None
+    if relative is None or relative.startswith(".."):
+        # No shared root: tag the basename with a short hash of the full path to keep it unique
+        digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:8]
+        relative = f"{os.path.basename(file_path)}-{digest}"
+    return os.path.join(output_dir, relative.replace(os.sep, "__") + ".json")
+
+def process_resume_batch(source, output_dir=None, max_workers=None, chunksize=None, use_cache=True, use_nlp=False,
+                         jsonl_path=None, compress=False):
+    """
+    Extract every resume in a directory (or listed in a manifest) across a process pool.
+    Writes one JSON result per input, or appends one record per input to `jsonl_path` as chunks
+    finish, and reports per-file failures without aborting the batch.
+    Work is dispatched in chunks so NLP classification runs as one `nlp.pipe` pass per chunk;
+    by default each worker gets about four chunks so small batches still spread across the pool.
+    """
+    output_dir = output_dir or PATHS["batch_output_dir"]
+    if not jsonl_path:
+        os.makedirs(output_dir, exist_ok=True)
+
+    paths = collect_resume_paths(source)
+    if not paths:
+        print(f"❌ No PDF or DOCX resumes found in {source}.")
+        return {"processed": 0, "succeeded": 0, "cache_hits": 0, "failed": []}
+
+    # Manifest entries are named relative to their shared root so same-named files in different folders don't collide
+    source_root = source if os.path.isdir(source) else _common_root(paths)
+    tasks = [(path, None if jsonl_path else _batch_output_path(path, output_dir, source_root)) for path in paths]
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, len(tasks) // (workers * 4))
+    chunks = [(tasks[i:i + chunksize], use_cache, use_nlp) for i in range(0, len(tasks), chunksize)]
+
+    print(f"✅ Processing {len(tasks)} resumes with {workers} workers in {len(chunks)} chunks...")
+    succeeded = 0
+    cache_hits = 0
+    failed = []
+    writer = JsonlWriter(jsonl_path, compress=compress) if jsonl_path else None
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker, initargs=(use_nlp,)) as pool:
+            futures = [pool.submit(_process_batch_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for outcome in future.result():
+                    if outcome["status"] == "ok":
+                        succeeded += 1
+                        cache_hits += outcome["cache"] == "hit"
+                        if writer:
+                            writer.write({"source": outcome["source"], **outcome.pop("result")})
+                    else:
+                        failed.append(outcome)
+                        print(f"⚠️ Failed: {outcome['source']} | {outcome['error']}")
+    finally:
+        if writer:
+            writer.close()  # Keep every record that finished, even if the pool breaks
+
+    destination = writer.output_path if writer else output_dir
+    print(f"✅ Batch complete: {succeeded}/{len(tasks)} succeeded ({cache_hits} from cache). Results in {destination}.")
+    return {"processed": len(tasks), "succeeded": succeeded, "cache_hits": cache_hits, "failed": failed}
+
 # Main execution block
 if __name__ == "__main__":
-    result = process_resume()
-    if result:
-        save_to_json(result)
+    parser = argparse.ArgumentParser(description="Extract structured data from resumes.")
+    parser.add_argument("--batch", metavar="SOURCE", help="Directory or manifest of resumes to process in parallel")
+    parser.add_argument("--output-dir", help="Directory for per-resume JSON results (batch mode)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the content-addressed extraction cache")
+    parser.add_argument("--nlp", action="store_true", help="Refine sections with spaCy NER (batched per worker)")
+    parser.add_argument("--jsonl", nargs="?", const=PATHS["resume_output_jsonl"], metavar="PATH",
+                        help="Append compact records to a JSON Lines file instead of writing pretty JSON")
+    parser.add_argument("--gzip", action="store_true", help="Gzip-compress JSON Lines output")
+    args = parser.parse_args()
+
+    if args.batch:
+        summary = process_resume_batch(args.batch, output_dir=args.output_dir, max_workers=args.workers,
+                                       use_cache=not args.no_cache, use_nlp=args.nlp,
+                                       jsonl_path=args.jsonl, compress=args.gzip)
+        if summary["failed"]:
+            sys.exit(1)
+    else:
+        result = process_resume(use_cache=not args.no_cache)
+        if result and args.nlp:
+            result["sections"] = apply_nlp_sections([result["sections"]])[0]
+        if result and args.jsonl:
+            source = PATHS["resume_pdf"] if os.path.exists(PATHS["resume_pdf"]) else PATHS["resume_file"]
+            save_to_jsonl(result, source=source, output_path=args.jsonl, compress=args.gzip)
+        elif result:
+            save_to_json(result)
+        if not args.no_cache:
+            print(f"📊 Extraction cache: {get_extraction_cache().stats()}")
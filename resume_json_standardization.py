@@ -1,5 +1,7 @@
 import json
 import re
+from collections import Counter
+import numpy as np
 from modules.utils.path_manager import PATHS
 
 SCHEMA_PATH = PATHS["resume_schema"]
@@ -17,6 +19,261 @@ STANDARD_SECTIONS = {
     "Strengths": ["Strengths", "Competencies"],
 }
 
+# Keywords that mark a section header anywhere in a line, in priority order
+HEADER_KEYWORDS = {
+    "experience": "Experience",
+    "education": "Education",
+    "skills": "Skills",
+}
+
+def normalize_heading(text):
+    """ Lowercase a heading and collapse whitespace and trailing punctuation for lookups. """
+    return " ".join(text.lower().split()).rstrip(":").strip()
+
+class SectionHeaderIndex:
+    """ Precomputed header lookups built once from STANDARD_SECTIONS. """
+
+    def __init__(self, standard_sections, header_keywords):
+        # Full headings ("Work Experience", "Profile", "Education") for line classification
+        self.headings = {}
+        # Every contiguous word run of each standard's variants, so a section name that
+        # appears as whole words inside a variant ("Contact", "Skills") resolves in one lookup
+        self.phrases = {}
+
+        for standard, variants in standard_sections.items():
+            for variant in variants:
+                self.headings.setdefault(normalize_heading(variant), standard)
+            words = normalize_heading(" ".join(variants)).split()
+            for start in range(len(words)):
+                for end in range(start + 1, len(words) + 1):
+                    self.phrases.setdefault(" ".join(words[start:end]), standard)
+
+        for standard in standard_sections:
+            self.headings.setdefault(normalize_heading(standard), standard)
+            self.phrases.setdefault(normalize_heading(standard), standard)
+
+        # Headings are short, so longer lines skip normalization and the dict lookup entirely
+        self.max_heading_length = max(len(heading) for heading in self.headings) + 8
+        # Plain substring tests on one lowercased copy outperform a regex alternation here
+        self.header_keywords = dict(header_keywords)
+
+    def match_section_name(self, section):
+        """ Map a resume JSON section name to its standard section, or None. """
+        return self.phrases.get(normalize_heading(section))
+
+    def match_line(self, line):
+        """ Return the standard section a resume line introduces, or None for body text. """
+        lowered = line.lower()
+        if len(lowered) <= self.max_heading_length:
+            standard = self.headings.get(normalize_heading(lowered))
+            if standard:
+                return standard
+
+        for keyword, standard in self.header_keywords.items():
+            if keyword in lowered:
+                return standard
+        return None
+
+    def classify_lines(self, lines):
+        """
+        Group lines under the most recent section header, skipping lines of three characters or fewer.
+        Same result as calling match_line per line, with the per-line work inlined: long lines only get
+        the keyword tests, short ones the full heading lookup, and the open section's list is reused.
+        """
+        current = "General"
+        sections = {current: []}
+        bucket = sections[current]
+        max_length = self.max_heading_length
+        keywords = tuple(self.header_keywords)
+        header_keywords = self.header_keywords
+        match_line = self.match_line
+
+        for line in lines:
+            if len(line.strip()) > 3:
+                lowered = line.lower()
+                if len(lowered) > max_length:
+                    for keyword in keywords:
+                        if keyword in lowered:
+                            if header_keywords[keyword] != current:
+                                current = header_keywords[keyword]
+                                bucket = sections.setdefault(current, [])
+                            break
+                else:
+                    standard = match_line(line)
+                    if standard and standard != current:
+                        current = standard
+                        bucket = sections.setdefault(current, [])
+                bucket.append(line)
+
+        if not sections["General"]:
+            del sections["General"]
+        return sections
+
+SECTION_HEADER_INDEX = SectionHeaderIndex(STANDARD_SECTIONS, HEADER_KEYWORDS)
+
+# Extra spellings that only the fuzzy matcher knows about. They are kept out of STANDARD_SECTIONS
+# so the exact phrase lookup doesn't start resolving their single words ("Stack", "Tools").
+SECTION_ALIASES = {
+    "Header": ["Contact Details", "Personal Information", "Personal Details"],
+    "Summary": ["Executive Summary", "Summary of Qualifications", "Objective", "Career Objective", "About Me"],
+    "Experience": ["Professional Experience", "Employment History", "Work Experience"],
+    "Education": ["Licenses and Certifications", "Training", "Coursework"],
+    "Skills": ["Tech Stack", "Technology Stack", "Technologies", "Tools and Technologies",
+               "Technical Proficiencies", "Skills Summary", "Programming Languages"],
+    "Projects": ["Portfolio"],
+    "Key Achievements": ["Awards and Honors", "Honors", "Highlights"],
+    "Strengths": ["Core Competencies"],
+}
+
+# Words that narrow a heading without changing what it is ("Relevant Experience", "Key Skills")
+QUALIFIER_WORDS = {
+    "professional", "relevant", "work", "career", "key", "selected", "technical", "core",
+    "additional", "other", "history", "background", "related", "recent", "notable",
+    "information", "info", "detail", "number", "address",
+}
+QUALIFIER_WEIGHT = 0.25
+HEADING_STOPWORDS = {"and", "of", "the", "my", "in", "for", "to", "a"}
+HEADING_WORD = re.compile(r"[a-z]+")
+
+# Minimum cosine similarity between a heading and its best-matching variant. Qualifier-only
+# differences score ~0.97, an extra content word ("Volunteer Experience") scores 0.71; every
+# threshold from 0.75 to 0.95 labels SECTION_HEADING_SAMPLES correctly (run this module to sweep).
+SIMILARITY_THRESHOLD = 0.8
+# Minimum character-trigram similarity for treating an unknown word as a misspelt known one
+TYPO_THRESHOLD = 0.65
+
+def _stem(word):
+    """ Fold simple plurals so "Technologies"/"Technology" and "Skills"/"Skill" compare equal. """
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+def heading_words(text):
+    """ Stemmed content words of a heading, in order. """
+    return [_stem(word) for word in HEADING_WORD.findall(text.lower()) if word not in HEADING_STOPWORDS]
+
+class SectionSimilarityIndex:
+    """
+    Weighted bag-of-words vectors for every standard section name, variant and alias, scored in bulk with NumPy.
+    A heading's score is its cosine similarity to the best-matching variant, so one extra content word is
+    enough to reject it. Unknown words are first mapped to a known word by character trigrams to absorb typos.
+    """
+
+    def __init__(self, standard_sections, aliases=None, threshold=SIMILARITY_THRESHOLD,
+                 typo_threshold=TYPO_THRESHOLD, ngram_size=3):
+        self.threshold = threshold
+        self.typo_threshold = typo_threshold
+        self.ngram_size = ngram_size
+        self.labels = []
+        rows = []
+        for standard, variants in standard_sections.items():
+            for name in dict.fromkeys([standard, *variants, *(aliases or {}).get(standard, [])]):
+                self.labels.append(standard)
+                rows.append(heading_words(name))
+
+        self.vocabulary = {}
+        for words in rows:
+            for word in words:
+                self.vocabulary.setdefault(word, len(self.vocabulary))
+        self.matrix = self._vectors(rows)
+
+        # Character trigrams of every known word, for spelling repair of unseen words
+        self.words = list(self.vocabulary)
+        self.gram_vocabulary = {}
+        gram_rows = [self._ngrams(word) for word in self.words]
+        for grams in gram_rows:
+            for gram in grams:
+                self.gram_vocabulary.setdefault(gram, len(self.gram_vocabulary))
+        self.gram_matrix = self._gram_vectors(gram_rows)
+
+        # normalized heading -> (standard or None, score); misses are memoized too
+        self._resolved = {}
+
+    def _ngrams(self, word):
+        padded = f" {word} "
+        return Counter(padded[i:i + self.ngram_size] for i in range(len(padded) - self.ngram_size + 1))
+
+    def _gram_vectors(self, gram_rows):
+        """ L2-normalized trigram counts; trigrams outside the known words still count toward the norm. """
+        vectors = np.zeros((len(gram_rows), len(self.gram_vocabulary)), dtype=np.float32)
+        norms = np.empty(len(gram_rows), dtype=np.float32)
+        for row, grams in enumerate(gram_rows):
+            norms[row] = np.sqrt(sum(count * count for count in grams.values())) or 1.0
+            for gram, count in grams.items():
+                column = self.gram_vocabulary.get(gram)
+                if column is not None:
+                    vectors[row, column] = count
+        return vectors / norms[:, None]
+
+    def _vectors(self, rows):
+        """ L2-normalized word weights; words outside the vocabulary still count toward the norm. """
+        vectors = np.zeros((len(rows), len(self.vocabulary)), dtype=np.float32)
+        norms = np.empty(len(rows), dtype=np.float32)
+        for row, words in enumerate(rows):
+            weights = {word: QUALIFIER_WEIGHT if word in QUALIFIER_WORDS else 1.0 for word in words}
+            norms[row] = np.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+            for word, weight in weights.items():
+                column = self.vocabulary.get(word)
+                if column is not None:
+                    vectors[row, column] = weight
+        return vectors / norms[:, None]
+
+    def _repair_spelling(self, rows):
+        """ Replace unknown words with their closest known word when the trigram similarity is high enough. """
+        unknown = sorted({word for words in rows for word in words if word not in self.vocabulary})
+        if not unknown:
+            return rows
+        scores = self._gram_vectors([self._ngrams(word) for word in unknown]) @ self.gram_matrix.T
+        best = scores.argmax(axis=1)
+        repaired = {word: self.words[best[row]] for row, word in enumerate(unknown)
+                    if scores[row, best[row]] >= self.typo_threshold}
+        return [[repaired.get(word, word) for word in words] for words in rows]
+
+    def score(self, headings):
+        """ Return {heading: (best standard, cosine score)} for every heading, scoring unseen ones in one multiply. """
+        pending = list(dict.fromkeys(normalize_heading(h) for h in headings if normalize_heading(h) not in self._resolved))
+        if pending:
+            rows = self._repair_spelling([heading_words(heading) for heading in pending])
+            scores = self._vectors(rows) @ self.matrix.T
+            best_rows = scores.argmax(axis=1)
+            for row, heading in enumerate(pending):
+                best_score = float(scores[row, best_rows[row]])
+                standard = self.labels[best_rows[row]] if best_score >= self.threshold else None
+                self._resolved[heading] = (standard, round(best_score, 4))
+
+        return {heading: self._resolved[normalize_heading(heading)] for heading in headings}
+
+    def resolve(self, headings):
+        """ Map each heading that clears the confidence threshold to its standard section. """
+        return {heading: standard for heading, (standard, _) in self.score(headings).items() if standard}
+
+SECTION_SIMILARITY_INDEX = SectionSimilarityIndex(STANDARD_SECTIONS, SECTION_ALIASES)
+
+# Hand-labelled headings (None = should be logged for review) used to tune SIMILARITY_THRESHOLD
+SECTION_HEADING_SAMPLES = [
+    ("Professional Experience", "Experience"), ("Relevant Experience", "Experience"),
+    ("Employment History", "Experience"), ("Experiance", "Experience"), ("Work Experience:", "Experience"),
+    ("Tech Stack", "Skills"), ("Technology Stack", "Skills"), ("Technologies", "Skills"), ("Key Skills", "Skills"),
+    ("Technical Expertise", "Skills"), ("Tools & Technologies", "Skills"), ("Skills Summary", "Skills"),
+    ("Core Competencies", "Strengths"), ("Executive Summary", "Summary"), ("Career Objective", "Summary"),
+    ("Summary of Qualifications", "Summary"), ("Educaton", "Education"), ("Education History", "Education"),
+    ("Licenses & Certifications", "Education"), ("Certificates", "Education"),
+    ("Awards & Honors", "Key Achievements"), ("Career Highlights", "Key Achievements"),
+    ("Technical Projects", "Projects"), ("Contact Details", "Header"), ("Email Address", "Header"),
+    ("Volunteer Experience", None), ("Hobbies", None), ("Interests", None), ("Publications", None),
+    ("Additional Information", None), ("References", None), ("Languages", None), ("Volunteer Work", None),
+    ("Experience Summary", None), ("Skills & Interests", None), ("Military Service", None),
+]
+
+def similarity_accuracy(index=None, samples=SECTION_HEADING_SAMPLES):
+    """ Share of labelled headings the similarity index resolves as expected, plus the misses. """
+    index = index or SECTION_SIMILARITY_INDEX
+    scored = index.score([heading for heading, _ in samples])
+    misses = [(heading, expected, scored[heading]) for heading, expected in samples if scored[heading][0] != expected]
+    return 1 - len(misses) / len(samples), misses
+
 def load_schema():
     """ Load the existing schema or return an empty template if missing. """
     try:
@@ -30,20 +287,19 @@ def save_schema(schema):
     with open(SCHEMA_PATH, "w", encoding="utf-8") as file:
         json.dump(schema, file, indent=4)
 
-def standardize_sections(resume_json):
-    """ Aligns resume sections to best practices and updates the schema dynamically. """
-    schema = load_schema()
+def _unmatched_sections(resume_json):
+    """ Section names with no exact standard match. """
+    return [section for section in resume_json if not SECTION_HEADER_INDEX.match_section_name(section)]
+
+def _split_sections(resume_json, fuzzy_matches=None):
+    """ Map sections to standard names; returns (standardized_resume, new_sections). """
+    fuzzy_matches = fuzzy_matches or {}
     standardized_resume = {}
     new_sections = {}
 
     for section, content in resume_json.items():
-        found_match = None
-
-        # Try to match existing standard sections
-        for standard, variants in STANDARD_SECTIONS.items():
-            if section.lower() in [v.lower() for v in variants] or re.search(r"\b" + section + r"\b", " ".join(variants), re.IGNORECASE):
-                found_match = standard
-                break
+        # Try to match existing standard sections, then a confident fuzzy match
+        found_match = SECTION_HEADER_INDEX.match_section_name(section) or fuzzy_matches.get(section)
 
         if found_match:
             # Assign the correct section name
@@ -52,10 +308,32 @@ def standardize_sections(resume_json):
             # Log the new section for review
             new_sections[section] = content
 
-    # Save newly discovered sections for later review
-    if new_sections:
+    return standardized_resume, new_sections
+
+def _log_new_sections(new_sections_list):
+    """
+    Write NEW_SECTIONS_LOG as {section: {"count", "sample"}}: how many resumes contained each
+    unrecognized section and the first content seen, most frequent first. Returns the section count.
+    """
+    discovered = {}
+    for new_sections in new_sections_list:
+        for section, content in new_sections.items():
+            entry = discovered.setdefault(section, {"count": 0, "sample": content})
+            entry["count"] += 1
+
+    if discovered:
+        ranked = dict(sorted(discovered.items(), key=lambda item: item[1]["count"], reverse=True))
         with open(NEW_SECTIONS_LOG, "w", encoding="utf-8") as file:
-            json.dump(new_sections, file, indent=4)
+            json.dump(ranked, file, indent=4)
+    return len(discovered)
+
+def standardize_sections(resume_json):
+    """ Aligns resume sections to best practices and logs unrecognized sections for review. """
+    fuzzy_matches = SECTION_SIMILARITY_INDEX.resolve(_unmatched_sections(resume_json))
+    standardized_resume, new_sections = _split_sections(resume_json, fuzzy_matches)
+
+    # Save newly discovered sections for later review
+    if _log_new_sections([new_sections]):
         print("🔍 New sections detected and logged for review.")
 
     return standardized_resume
@@ -75,3 +353,35 @@ def process_resume_json(resume_json):
     standardized_json = standardize_sections(resume_json)
     validated_json = validate_resume_json(standardized_json)
     return validated_json
+
+def process_resume_json_batch(resume_jsons):
+    """
+    Standardize and validate many resumes with one fuzzy-matching pass and one review log.
+    New sections are merged across the batch with how many resumes contained them
+    and the first content seen, and NEW_SECTIONS_LOG is written once at the end.
+    """
+    resume_jsons = list(resume_jsons)
+    results = []
+    new_sections_list = []
+
+    # Score every unmatched heading in the batch against the variant matrix at once
+    unmatched = [section for resume_json in resume_jsons for section in _unmatched_sections(resume_json)]
+    fuzzy_matches = SECTION_SIMILARITY_INDEX.resolve(unmatched)
+
+    for resume_json in resume_jsons:
+        standardized_json, new_sections = _split_sections(resume_json, fuzzy_matches)
+        results.append(validate_resume_json(standardized_json))
+        new_sections_list.append(new_sections)
+
+    logged = _log_new_sections(new_sections_list)
+    if logged:
+        print(f"🔍 {logged} new sections across {len(results)} resumes logged for review.")
+
+    return results
+
+if __name__ == "__main__":
+    # ✅ Threshold sweep over the labelled headings
+    for threshold in (0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95):
+        accuracy, misses = similarity_accuracy(SectionSimilarityIndex(STANDARD_SECTIONS, SECTION_ALIASES, threshold))
+        print(f"{'✅' if not misses else '⚠️'} threshold {threshold:.2f}: {accuracy:.0%} of {len(SECTION_HEADING_SAMPLES)} headings"
+              + (f" | misses: {', '.join(heading for heading, _, _ in misses)}" if misses else ""))